@@ -18,16 +18,20 @@ from PySide6.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QHBoxLayout, QVBoxLayout,
     QListWidget, QLineEdit, QFileDialog, QScrollArea, QGridLayout, QMessageBox,
     QSizePolicy, QListWidgetItem, QInputDialog, QLayout, QStatusBar,
-    QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QMenu, QGraphicsOpacityEffect
+    QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QGraphicsItem, QMenu,
+    QListView, QAbstractItemView, QStyledItemDelegate, QStyleOptionViewItem, QStyle
 )
-from PySide6.QtGui import QPixmap, QImage, QColor, QFont, QIcon, QFontMetrics, QPainter, QAction, QKeySequence
-from PySide6.QtCore import Qt, QSize, QEvent, QTimer, Signal, QPointF, QObject
+from PySide6.QtGui import QPixmap, QImage, QColor, QFont, QIcon, QFontMetrics, QPainter, QAction, QKeySequence, QPixmapCache
+from PySide6.QtCore import Qt, QSize, QEvent, QTimer, Signal, QSignalBlocker, QPoint, QPointF, QRect, QObject, QAbstractListModel, QModelIndex, QRunnable, QThreadPool, QEventLoop
 import sys, os
-from PIL import Image, ImageSequence, ImagePalette
+from PIL import Image, ImageSequence, ImagePalette, GifImagePlugin
 import json
+import threading
+from contextlib import contextmanager
 import traceback
-from functools import partial
+from functools import partial, lru_cache
 import bisect
+from array import array
 import math
 import re
 
@@ -44,6 +48,169 @@ DARKER_COLOR_MAP = {
     "#353535": "#2A2A2A",
     "#404040": "#333333",
 }
+# 조회 시 매번 .upper() 하지 않도록 키/값을 대문자로 정규화 (추출된 HEX도 대문자로 반환)
+DARKER_COLOR_MAP = {k.upper(): v.upper() for k, v in DARKER_COLOR_MAP.items()}
+
+# 미리보기 배율 단계 (1.0x 위치는 모듈 로드 시 1회 계산)
+SCALE_LEVELS = (0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0, 3.25, 3.5, 3.75, 4.0, 5.0, 6.0, 7.0, 8.0)
+_SCALE_DEFAULT_INDEX = SCALE_LEVELS.index(1.0)
+
+def _nearest_scale_index(scale_factor):
+    insert_point = bisect.bisect_left(SCALE_LEVELS, scale_factor)
+    if insert_point <= 0:
+        return 0
+    if insert_point >= len(SCALE_LEVELS):
+        return len(SCALE_LEVELS) - 1
+    if scale_factor - SCALE_LEVELS[insert_point - 1] <= SCALE_LEVELS[insert_point] - scale_factor:
+        return insert_point - 1
+    return insert_point
+
+# 프리뷰 프레임 픽스맵 캐시 한도 (KB 단위, 기본 10MB는 큰 GIF에서 금방 밀려남)
+_PIXMAP_CACHE_LIMIT_KB = 256 * 1024
+
+def _skip_gif_sub_blocks(data, pos):
+    data_size = len(data)
+    while pos < data_size:
+        block_size = data[pos]
+        pos += 1
+        if block_size == 0:
+            break
+        pos += block_size
+    return pos
+
+def _fast_count_frames(path):
+    # 픽셀 디코딩 없이 GIF 블록 헤더만 훑어서 프레임(이미지 디스크립터) 수를 셈
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < 13 or data[:3] != b'GIF':
+        return 0
+
+    pos = 13
+    if data[10] & 0x80: # 전역 색상표 건너뛰기
+        pos += 3 * (2 << (data[10] & 0x07))
+
+    frame_count = 0
+    data_size = len(data)
+    while pos < data_size:
+        block_type = data[pos]
+        if block_type == 0x2C: # 이미지 디스크립터
+            if pos + 10 > data_size:
+                break
+            packed = data[pos + 9]
+            pos += 10
+            if packed & 0x80: # 지역 색상표 건너뛰기
+                pos += 3 * (2 << (packed & 0x07))
+            pos = _skip_gif_sub_blocks(data, pos + 1) # LZW 최소 코드 크기 1바이트 다음부터 이미지 데이터
+            frame_count += 1
+        elif block_type == 0x21: # 확장 블록
+            pos = _skip_gif_sub_blocks(data, pos + 2)
+        else: # 0x3B 트레일러 또는 손상된 데이터
+            break
+    return frame_count
+
+def _format_frame_label(frame_idx):
+    if frame_idx < 100:
+        return f"{frame_idx:02d}F"
+    elif frame_idx < 1000:
+        return f"{frame_idx:03d}F"
+    else:
+        return f"{frame_idx:04d}F"
+
+def _frame_to_rgba(frame, frame_info):
+    if frame.mode == 'P':
+        return frame.convert("RGBA") if 'transparency' in frame_info else frame.convert("RGB").convert("RGBA")
+    return frame.convert("RGBA")
+
+# 버튼 스타일 문자열에서 배경색을 찾고 바꾸는 정규식 (모듈 로드 시 1회 컴파일)
+_BG_RE = re.compile(r"background-color:\s*(#[0-9a-fA-F]{6})", re.IGNORECASE)
+_BG_SUB_RE = re.compile(r"(background-color:\s*)(#[0-9a-fA-F]{6})", re.IGNORECASE)
+
+# 출력 파일명에 쓸 수 없는 문자 (문자/숫자/밑줄/공백/하이픈 외) - str.isalnum() 기준과 동일
+_UNSAFE_NAME_CHAR_RE = re.compile(r"[^\w \-]")
+
+# 고정 버튼 스타일 문자열 (매번 dict 에서 조합하지 않도록 미리 작성)
+_ADD_KF_STYLE = "background-color: #4CAF50; color: white; border-radius: 5px; padding: 8px;"
+_REMOVE_KF_STYLE = "background-color: #F44336; color: white; border-radius: 5px; padding: 8px;"
+_PLAYBACK_BTN_STYLE = "border: 1px solid #2A2A2A; border-radius: 5px; padding: 0px; background-color: #3C3C3C;"
+_FILE_BTN_STYLE = "color: white; border-radius: 5px; padding: 0 10px; background-color: #303030;"
+_DESC_BTN_STYLE = "color: white; border-radius: 3px; padding: 0 8px; background-color: #303030;"
+# 메인 창 스타일시트: 스크롤바/리스트/타임라인 공통 규칙을 한 곳에서 1회만 파싱
+# (QApplication 스타일시트는 부모 위젯의 배경색 규칙에 밀리므로 메인 창에 적용)
+_MAIN_WINDOW_STYLE = """
+    * { background-color: #202020; color: white; }
+
+    QScrollArea#timeline_scroll { border: none; background-color: #202020; }
+    QScrollArea#timeline_scroll::corner { background: #111111; }
+    QScrollArea#timeline_scroll > QWidget { background-color: #202020; }
+
+    QListWidget#motion_list {
+        background-color: #111111;
+        border: 1px solid #333;
+        border-radius: 5px;
+    }
+    QListWidget#motion_list::item {
+        padding-top: 3px;
+        padding-bottom: 3px;
+        padding-left: 1px;
+        padding-right: 1px;
+    }
+    QListWidget#motion_list::item:selected { background-color: #4A4A70; }
+
+    QListView#frame_preview {
+        background-color: #111111; color: white;
+        border: 1px solid #333; border-radius: 5px;
+    }
+    QListView#frame_preview::item {
+        padding-top: 1px;
+        padding-bottom: 1px;
+        padding-left: 1px;
+        padding-right: 1px;
+    }
+
+    QPushButton#exportBtn {
+        color: white; border-radius: 5px; padding: 0 15px; background-color: #303030;
+    }
+    QPushButton#exportBtn:pressed { background-color: #262626; }
+
+    QScrollBar:horizontal {
+        height: 8px; background-color: #111111; margin: 0px; border-radius: 4px;
+    }
+    QScrollBar::handle:horizontal {
+        background: #808080; min-width: 20px; border-radius: 4px;
+    }
+    QScrollBar::handle:horizontal:hover { background: #A0A0A0; }
+    QScrollBar::handle:horizontal:pressed { background: #606060; }
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        background: none; border: none; width: 0px; height: 0px;
+    }
+    QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal { background: #111111; }
+
+    QScrollBar:vertical {
+        width: 8px; background-color: #111111; margin: 0px; border-radius: 4px;
+    }
+    QScrollBar::handle:vertical {
+        background: #808080; min-height: 20px; border-radius: 4px;
+    }
+    QScrollBar::handle:vertical:hover { background: #A0A0A0; }
+    QScrollBar::handle:vertical:pressed { background: #606060; }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        background: none; border: none; width: 0px; height: 0px;
+    }
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical { background: #111111; }
+"""
+
+# 타임라인 프레임 버튼 상태별 스타일 - 버튼마다 스타일시트를 두지 않고 frameState 속성으로 규칙을 고름
+_TIMELINE_STYLE = """
+    QWidget#timeline_widget { background-color: #202020; padding-top: 5px; }
+    FrameButton {
+        padding: 0px; margin: 0px; color: white;
+        border: 1px solid rgba(0, 0, 0, 0.5); background-color: #404040;
+    }
+    FrameButton[frameState="segment"] { background-color: #353535; }
+    FrameButton[frameState="keyframe"] { background-color: #202020; border: 2px solid orange; }
+    FrameButton[frameState="selected"] { background-color: #FFFFFF; color: black; border: 2px solid #ffffff; }
+    FrameButton[frameState="selected_keyframe"] { background-color: #FFFFFF; color: black; border: 2px solid orange; }
+"""
 
 class CustomStyledButton(QPushButton): # 파일 관리, 재생 제어, 추출, 메인 키프레임 버튼용
     def __init__(self, text_or_icon=None, parent=None):
@@ -59,6 +226,8 @@ class CustomStyledButton(QPushButton): # 파일 관리, 재생 제어, 추출, 
         self._is_currently_pressed = False
 
     def setCustomStyles(self, normal_style, pressed_style):
+        if normal_style == self._normal_style_sheet and pressed_style == self._pressed_style_sheet:
+            return # 같은 스타일 재적용 시 스타일시트 재파싱 생략
         self._normal_style_sheet = normal_style
         self._pressed_style_sheet = pressed_style
         if not self._is_currently_pressed:
@@ -76,12 +245,7 @@ class CustomStyledButton(QPushButton): # 파일 관리, 재생 제어, 추출, 
             pass
 
     def _derive_pressed_style(self, base_style):
-        current_bg_hex = CustomStyledButton._extract_background_color_hex(base_style)
-        if current_bg_hex:
-            darker_bg_hex = DARKER_COLOR_MAP.get(current_bg_hex.upper())
-            if darker_bg_hex:
-                return CustomStyledButton._replace_background_color_in_style(base_style, darker_bg_hex)
-        return base_style
+        return _derive_pressed_cached(base_style)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton and self.isEnabled():
@@ -93,26 +257,25 @@ class CustomStyledButton(QPushButton): # 파일 관리, 재생 제어, 추출, 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton and self.isEnabled() and self._is_currently_pressed:
             self._is_currently_pressed = False
-            super().setStyleSheet(self._normal_style_sheet)
+            if self._pressed_style_sheet:
+                super().setStyleSheet(self._normal_style_sheet)
         super().mouseReleaseEvent(event)
 
     @staticmethod
     def _extract_background_color_hex(style_sheet_str):
         if not style_sheet_str: return None
-        matches = re.findall(r"background-color:\s*(#[0-9a-fA-F]{6})", style_sheet_str, re.IGNORECASE)
-        if matches:
-            return matches[0]
+        match = _BG_RE.search(style_sheet_str)
+        if match:
+            return match.group(1).upper()
         return None
 
     @staticmethod
     def _replace_background_color_in_style(original_style, new_bg_color_hex):
         if not original_style: original_style = ""
-        replaced_style, num_replacements = re.subn(
-            r"(background-color:\s*)(#[0-9a-fA-F]{6})",
+        replaced_style, num_replacements = _BG_SUB_RE.subn(
             rf"\g<1>{new_bg_color_hex}",
             original_style,
-            count=1,
-            flags=re.IGNORECASE
+            count=1
         )
         if num_replacements > 0:
             return replaced_style
@@ -121,6 +284,97 @@ class CustomStyledButton(QPushButton): # 파일 관리, 재생 제어, 추출, 
                 original_style += ";"
             return f"{original_style.strip()} background-color: {new_bg_color_hex};".strip()
 
+@lru_cache(maxsize=128)
+def _derive_pressed_cached(base_style):
+    # 버튼들이 공유하는 기본 스타일은 몇 종류뿐이므로, 스타일 문자열별로 pressed 스타일을 캐시
+    current_bg_hex = CustomStyledButton._extract_background_color_hex(base_style)
+    if current_bg_hex:
+        darker_bg_hex = DARKER_COLOR_MAP.get(current_bg_hex)
+        if darker_bg_hex:
+            return CustomStyledButton._replace_background_color_in_style(base_style, darker_bg_hex)
+    return base_style
+
+@lru_cache(maxsize=32)
+def _pressed_style_from_normal_cached(normal_style_str, original_bg_color_key=None):
+    # 원래 배경색 키를 알고 있으면 스타일 문자열 파싱 없이 어두운 색을 찾음
+    if original_bg_color_key in DARKER_COLOR_MAP:
+        current_bg_hex = original_bg_color_key
+    else:
+        current_bg_hex = CustomStyledButton._extract_background_color_hex(normal_style_str)
+
+    if current_bg_hex:
+        darker_bg_hex = DARKER_COLOR_MAP.get(current_bg_hex)
+        if darker_bg_hex:
+            return CustomStyledButton._replace_background_color_in_style(normal_style_str, darker_bg_hex)
+    return normal_style_str
+
+# GifImagePlugin.LOADING_STRATEGY는 프로세스 전역 값이고 Image.open이 아니라 seek 할 때마다 읽힘.
+# 전략을 바꾸는 출력 작업 스레드와 기본 전략으로 디코딩하는 UI의 GIF 불러오기가 모두 이 잠금 안에서만 GIF를 읽음
+_GIF_LOADING_STRATEGY_LOCK = threading.Lock()
+
+@contextmanager
+def _gif_loading_strategy(strategy):
+    with _GIF_LOADING_STRATEGY_LOCK:
+        previous_strategy = GifImagePlugin.LOADING_STRATEGY
+        GifImagePlugin.LOADING_STRATEGY = strategy
+        try:
+            yield
+        finally:
+            GifImagePlugin.LOADING_STRATEGY = previous_strategy
+
+def _write_motion_gifs(gif_path, segments, loop_count, background_idx):
+    # segments: [(output_path, [(frame_idx, info, delay), ...]), ...] - UI 객체 없이 평범한 데이터만 사용
+    exported_basenames = []
+    # 전역 팔레트를 공유하는 프레임은 P 모드 그대로 seek 해서 save가 프레임마다 다시 양자화하지 않게 함
+    # (기본 전략은 2번째 프레임부터 RGB로 풀어 버려 매 프레임 팔레트를 새로 만듦, 시간 대부분이 여기서 소모)
+    with _gif_loading_strategy(GifImagePlugin.LoadingStrategy.RGB_AFTER_DIFFERENT_PALETTE_ONLY):
+        # 원본 GIF를 한 번 열어 필요한 프레임만 순서대로 seek (모션 키가 오름차순이라 되감기 없음)
+        with Image.open(gif_path) as src_img:
+            for output_path, segment_frames in segments:
+                segment_frames_for_save = []; segment_delays_for_save = []
+                for frame_idx, frame_info, delay in segment_frames:
+                    src_img.seek(frame_idx)
+                    frame_to_save = src_img.copy()
+                    frame_to_save.info = frame_info.copy()
+                    # P 모드로 남은 프레임은 첫 프레임의 투명 인덱스 기준으로 합성되어 있음
+                    if frame_to_save.mode == 'P' and 'transparency' in src_img.info:
+                        frame_to_save.info['transparency'] = src_img.info['transparency']
+                    segment_frames_for_save.append(frame_to_save)
+                    segment_delays_for_save.append(delay)
+
+                first_frame_to_save = segment_frames_for_save[0]
+                save_options = {
+                    'save_all': True, 'append_images': segment_frames_for_save[1:],
+                    'duration': segment_delays_for_save, 'loop': loop_count, 'optimize': False,
+                }
+                if background_idx is not None: save_options['background'] = background_idx
+                first_frame_to_save.save(output_path, **save_options)
+                exported_basenames.append(os.path.basename(output_path))
+    return exported_basenames
+
+class GifExportError(RuntimeError): # 작업 스레드에서 난 예외, 원래 traceback을 UI 스레드로 전달
+    def __init__(self, message, worker_traceback):
+        super().__init__(message)
+        self.worker_traceback = worker_traceback
+
+class _GifExportSignals(QObject):
+    finished = Signal(list)
+    failed = Signal(str, str)
+
+class GifExportWorker(QRunnable): # 모션 GIF 인코딩을 UI 스레드 밖에서 수행
+    def __init__(self, gif_path, segments, loop_count, background_idx):
+        super().__init__()
+        self.signals = _GifExportSignals()
+        self._args = (gif_path, segments, loop_count, background_idx)
+
+    def run(self):
+        try:
+            exported_basenames = _write_motion_gifs(*self._args)
+        except Exception as e:
+            self.signals.failed.emit(str(e), traceback.format_exc())
+            return
+        self.signals.finished.emit(exported_basenames)
+
 class FrameButton(QPushButton):
     doubleClickedWithIndex = Signal(int)
 
@@ -147,14 +401,98 @@ class CustomMotionListWidget(QListWidget):
                 return
         super().mouseDoubleClickEvent(event)
 
+class MotionItemDelegate(QStyledItemDelegate): # 모션 리스트용, 아이템마다 QLabel(HTML) 대신 색상별 텍스트 구간을 직접 그림
+    RUNS_ROLE = Qt.ItemDataRole.UserRole + 1 # (시작 번호, " ~ 끝 번호 : ", 모션 이름)
+    KEYFRAME_COLOR = QColor("#FFA500")
+    DEFAULT_TEXT_COLOR = QColor("#FFFFFF")
+
+    def paint(self, painter, option, index):
+        runs = index.data(self.RUNS_ROLE)
+        if runs is None:
+            super().paint(painter, option, index)
+            return
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget) # 배경/선택 표시만 그림
+
+        painter.save()
+        painter.setFont(opt.font)
+        font_metrics = QFontMetrics(opt.font)
+        rect = opt.rect
+        x = rect.left()
+        for text, color in zip(runs, (self.KEYFRAME_COLOR, self.DEFAULT_TEXT_COLOR, self.KEYFRAME_COLOR)):
+            painter.setPen(color)
+            painter.drawText(QRect(x, rect.top(), rect.right() - x + 1, rect.height()), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+            x += font_metrics.horizontalAdvance(text)
+        painter.restore()
+
+class FramePreviewModel(QAbstractListModel): # 프레임 설명 미리보기용, 행 텍스트는 표시될 때 생성
+    HEADER_COLOR = QColor("#FFA07A")
+    SELECTED_COLOR = QColor("cyan")
+
+    def __init__(self, parent_ui, parent=None):
+        super().__init__(parent)
+        self.parent_ui = parent_ui
+        self._rows = [] # 프레임 행은 프레임 인덱스(int), 구간 헤더 행은 헤더 문자열(str)
+        self._text_cache = {}
+        self._header_size = QSize()
+        self._frame_rows = None # 프레임 인덱스 -> 행 번호, 선택 강조 갱신 때 처음 필요할 때 만듦
+
+    def set_rows(self, rows, header_height=-1, header_width=-1):
+        self.beginResetModel()
+        self._rows = rows
+        self._text_cache = {}
+        self._header_size = QSize(header_width, header_height)
+        self._frame_rows = None
+        self.endResetModel()
+
+    def update_selected_frame(self, previous_index, current_index):
+        # 선택 프레임이 바뀌면 모델 전체를 다시 만들지 않고 강조색이 바뀌는 두 행만 다시 그림
+        if self._frame_rows is None:
+            self._frame_rows = {entry: row for row, entry in enumerate(self._rows) if not isinstance(entry, str)}
+        for frame_idx in (previous_index, current_index):
+            row = self._frame_rows.get(frame_idx)
+            if row is not None:
+                model_index = self.index(row)
+                self.dataChanged.emit(model_index, model_index, [Qt.ItemDataRole.ForegroundRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def row_text(self, row):
+        entry = self._rows[row]
+        if isinstance(entry, str):
+            return entry
+        text = self._text_cache.get(entry)
+        if text is None:
+            text = f"{self.parent_ui._format_frame_number(entry)} : {self.parent_ui.all_frame_data[entry]['delay']}ms"
+            self._text_cache[entry] = text
+        return text
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._rows[index.row()]
+        is_header = isinstance(entry, str)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.row_text(index.row())
+        if role == Qt.ItemDataRole.UserRole:
+            return -1 if is_header else entry
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if is_header:
+                return self.HEADER_COLOR
+            return self.SELECTED_COLOR if entry == self.parent_ui.selected_index else None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter if is_header else None
+        if role == Qt.ItemDataRole.SizeHintRole:
+            return self._header_size if is_header else None
+        return None
+
 class OpacityButton(QPushButton):
     def __init__(self, icon_path="", parent=None):
         super().__init__(parent)
-        if icon_path:
-            self.setIcon(QIcon(icon_path))
-
-        self.opacity_effect = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self.opacity_effect)
 
         self.base_opacity_enabled = 0.20
         self.base_opacity_disabled = 0.05
@@ -164,17 +502,55 @@ class OpacityButton(QPushButton):
         self._is_pressed = False
         self._is_hovered = False
 
+        # QGraphicsOpacityEffect 대신 상태별 불투명도가 미리 적용된 아이콘을 교체하는 방식
+        self._icon_variants = {}
+        if icon_path:
+            self._build_icon_variants(icon_path)
+
         self._update_opacity()
 
+    def _build_icon_variants(self, icon_path):
+        source_pixmap = QPixmap(icon_path)
+        if source_pixmap.isNull():
+            return
+
+        opacity_levels = {
+            "disabled": self.base_opacity_disabled,
+            "pressed": self.pressed_opacity,
+            "hover": self.hover_opacity,
+            "base": self.base_opacity_enabled,
+        }
+        for state, opacity in opacity_levels.items():
+            cache_key = f"opacity_icon:{icon_path}:{opacity}"
+            pixmap = QPixmapCache.find(cache_key)
+            if pixmap is None:
+                image = QImage(source_pixmap.size(), QImage.Format.Format_ARGB32_Premultiplied)
+                image.fill(Qt.GlobalColor.transparent)
+                painter = QPainter(image)
+                painter.setOpacity(opacity)
+                painter.drawPixmap(0, 0, source_pixmap)
+                painter.end()
+                pixmap = QPixmap.fromImage(image)
+                QPixmapCache.insert(cache_key, pixmap)
+
+            icon = QIcon()
+            for mode in (QIcon.Mode.Normal, QIcon.Mode.Active, QIcon.Mode.Disabled):
+                icon.addPixmap(pixmap, mode)
+            self._icon_variants[state] = icon
+
     def _update_opacity(self):
         if not self.isEnabled():
-            self.opacity_effect.setOpacity(self.base_opacity_disabled)
+            state = "disabled"
         elif self._is_pressed:
-            self.opacity_effect.setOpacity(self.pressed_opacity)
+            state = "pressed"
         elif self._is_hovered:
-            self.opacity_effect.setOpacity(self.hover_opacity)
+            state = "hover"
         else:
-            self.opacity_effect.setOpacity(self.base_opacity_enabled)
+            state = "base"
+
+        icon = self._icon_variants.get(state)
+        if icon is not None:
+            self.setIcon(icon)
 
     def setEnabled(self, enabled):
         super().setEnabled(enabled)
@@ -209,21 +585,54 @@ class OpacityButton(QPushButton):
             self._is_hovered = self.rect().contains(event.position().toPoint())
             self._update_opacity()
 
+class ExposedRectPixmapItem(QGraphicsPixmapItem): # 프리뷰용, 뷰포트에 노출된 영역만 그림
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption, True)
+
+    def paint(self, painter, option, widget=None):
+        pixmap = self.pixmap()
+        if pixmap.isNull():
+            return
+        # 고배율에서 전체 픽스맵 대신 보이는 영역(픽셀 경계로 정렬)만 변환하여 그림
+        # 부드럽게 모드의 쌍선형 샘플링이 원본 영역 안으로 제한되므로, 1텍셀 여유를 두어 부분 갱신 경계에 이음새가 생기지 않게 함
+        source_rect = option.exposedRect.toAlignedRect().adjusted(-1, -1, 1, 1).intersected(pixmap.rect())
+        if source_rect.isEmpty():
+            return
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, self.transformationMode() == Qt.TransformationMode.SmoothTransformation)
+        painter.drawPixmap(source_rect, pixmap, source_rect)
+
 class GifSplitterUI(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Gif_Animation_Sampler v0.521")
-        self.setStyleSheet("background-color: #202020; color: white;")
+        self.setStyleSheet(_MAIN_WINDOW_STYLE)
         self.setMinimumSize(1280, 720)
 
         self.gif_path = None
+        # gif_path에서 파생되는 이름들 (GIF 로드 시 1회 계산, 저장/출력 대화상자에서 재사용)
+        self._gif_basename = ""
+        self._gif_base_no_ext = ""
+        self._gif_dirname = ""
         self.project_path = None # 현재 프로젝트 파일 경로 저장
+        self._called_from_export_all = False # 일괄 저장 중에는 개별 출력의 메시지 박스를 띄우지 않음
+        self._export_all_errors = []
+        self._exporting = False # 작업 스레드가 모션 GIF를 쓰는 동안 True (창 닫기를 막음)
         self.keyframes = {}
+        self._sorted_keyframes_cache = None # 정렬된 키프레임 목록 캐시 (keyframes 키 변경 시 None으로 무효화)
+        self._motion_map_cache = None # (정렬 키 목록, 프레임별 모션 시작 array, 끝 array) - 정렬 키 캐시가 새로 만들어지면 재생성
+        self._motion_list_row_keys = () # 모션 리스트 각 행의 시작 키프레임 (refresh_motion_list에서 갱신)
+        self._styled_sorted_keys = None # 마지막으로 전체 프레임 버튼 스타일을 적용한 시점의 정렬 키 목록
         self.frame_buttons = []
+        self._frame_button_pool = [] # clear_timeline에서 숨겨 둔 프레임 버튼, 다음 GIF 로드 때 재사용
         self.selected_index = None
         self.unsaved_changes = False
         self.original_gif_info = {}
         self.all_frame_data = []
+        self._last_frame_idx = -1 # len(all_frame_data) - 1, 프레임 데이터가 바뀔 때만 갱신 (재생 경로에서 재사용)
+        self._frame_rgba_buffer = None # 전체 프레임 RGBA 픽셀을 이어 붙인 단일 버퍼 (프리뷰 전용)
+        self._frame_size = (0, 0)
+        self._frame_label_cache = [] # 프레임 번호 라벨("00F" 등), GIF 로드 시 1회 생성
         self.original_gif_palette_data = None
         self.pressed_motion_list_item = None
         self.pressed_frame_preview_item = None
@@ -232,11 +641,8 @@ class GifSplitterUI(QWidget):
         self.graphics_scene = None
         self.pixmap_item = None
 
-        self.scale_levels = [0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0, 3.25, 3.5, 3.75, 4.0, 5.0, 6.0, 7.0, 8.0]
-        try:
-            self.current_scale_index = self.scale_levels.index(1.0)
-        except ValueError:
-            self.current_scale_index = 3
+        self.scale_levels = SCALE_LEVELS
+        self.current_scale_index = _SCALE_DEFAULT_INDEX
         self.current_scale_factor = self.scale_levels[self.current_scale_index]
         self.current_transformation_mode = Qt.TransformationMode.SmoothTransformation
 
@@ -247,7 +653,29 @@ class GifSplitterUI(QWidget):
 
         self.playback_timer = QTimer(self)
         self.playback_timer.setSingleShot(True)
+        self.playback_timer.setTimerType(Qt.TimerType.CoarseTimer) # GIF 딜레이는 ±5% 오차로 충분, 고해상도 OS 타이머 요청 방지
         self.current_playback_frame_index = -1
+        # 재생 중에는 미리보기 픽스맵만 매 프레임 교체하고, 타임라인/목록 등 나머지 UI는 최대 150ms 간격으로 동기화
+        self._playback_ui_sync_timer = QTimer(self)
+        self._playback_ui_sync_timer.setSingleShot(True)
+        self._playback_ui_sync_timer.setInterval(150)
+        self._playback_ui_sync_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._playback_ui_sync_timer.timeout.connect(self._sync_playback_ui)
+
+        # 휠 줌 입력은 누적했다가 16ms 뒤 한 번에 배율 적용 (터치패드의 잦은 작은 delta 대응)
+        self._wheel_accum = 0
+        self._wheel_timer = QTimer(self)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(16)
+        self._wheel_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._wheel_timer.timeout.connect(self._flush_wheel_zoom)
+
+        # 창 휠로 프레임 이동 시 한 이벤트 루프 안의 여러 틱을 select_frame 1회로 합침
+        self._pending_wheel_index = None
+        self._wheel_select_timer = QTimer(self)
+        self._wheel_select_timer.setSingleShot(True)
+        self._wheel_select_timer.setInterval(0)
+        self._wheel_select_timer.timeout.connect(self._flush_wheel_select)
         self.is_looping_specific_motion = False
         self.active_motion_start_index = -1
         self.active_motion_end_index = -1
@@ -262,61 +690,71 @@ class GifSplitterUI(QWidget):
         if status_font_size <=0 : status_font_size = 8
 
         self.status_label_font = QFont(QApplication.font().family(), status_font_size)
+        self._status_font_cached = None
+        self._get_status_font()
 
         self.status_label_default_style = f"font-size: {status_font_size}pt; color: rgba(204, 204, 204, 179); padding-left: 6px; padding-right: 6px; background-color: transparent;"
         self.status_label_loading_style = f"font-size: {status_font_size}pt; color: rgba(204, 204, 204, 179); padding-left: 6px; padding-right: 6px; background-color: #2f3c53;"
         self.status_label_complete_style = f"font-size: {status_font_size}pt; color: rgba(204, 204, 204, 179); padding-left: 6px; padding-right: 6px; background-color: #2f3c53;"
 
+        QPixmapCache.setCacheLimit(_PIXMAP_CACHE_LIMIT_KB)
+
         self._status_timer = QTimer(self)
         self._status_timer.setSingleShot(True)
+        self._status_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self._status_timer.timeout.connect(self._clear_status_loading_style)
+
+        # 재생 중 프레임마다 들어오는 상태 갱신은 100ms 단위로 묶어 마지막 것만 반영
+        self._status_debounce = QTimer(self)
+        self._status_debounce.setSingleShot(True)
+        self._status_debounce.setInterval(100)
+        self._status_debounce.timeout.connect(self._flush_pending_status)
+        self._pending_status = None
         self._current_status_message_for_timer = ""
+        self._applied_status = None # 마지막으로 표시한 (문구, 로딩, 완료) - 같은 상태 재적용 생략용
+        self._applied_status_style = None
 
         self._init_playback_buttons()
         self._init_preview_control_buttons()
 
-        self.add_keyframe_style_base = {"background-color": "#4CAF50", "color": "white", "border-radius": "5px", "padding": "8px"}
-        self.remove_keyframe_style_base = {"background-color": "#F44336", "color": "white", "border-radius": "5px", "padding": "8px"}
+        self.add_keyframe_style = _ADD_KF_STYLE
+        self.remove_keyframe_style = _REMOVE_KF_STYLE
+        # 키프레임 버튼 토글 시 재계산하지 않도록 pressed 스타일도 1회만 생성
+        self._add_kf_pressed_style = self._get_pressed_style_from_normal(self.add_keyframe_style, "#4CAF50")
+        self._remove_kf_pressed_style = self._get_pressed_style_from_normal(self.remove_keyframe_style, "#F44336")
 
-        self.add_keyframe_style = self._generate_style_str_from_dict(self.add_keyframe_style_base)
-        self.remove_keyframe_style = self._generate_style_str_from_dict(self.remove_keyframe_style_base)
+        # eventFilter 분기표: 감시 대상 객체 -> 처리 함수 (if/elif 연쇄 대신 사전 조회 1회)
+        self._event_handlers = {}
 
         self.init_ui()
         self.connect_signals()
         self._update_primary_keyframe_button_ui()
         self._update_preview_button_states()
 
+        self._event_handlers[self] = self._handle_window_event
         self.installEventFilter(self)
         if self.graphics_view:
+            self._event_handlers[self.graphics_view.viewport()] = self._handle_preview_viewport_event
             self.graphics_view.viewport().installEventFilter(self)
 
-    def _generate_style_str_from_dict(self, style_dict):
-        return "; ".join([f"{key}: {value}" for key, value in style_dict.items()]) + ";"
+        # 휠 이벤트를 자체 스크롤에 넘길 목록/타임라인의 viewport (휠마다 비교 연쇄 대신 집합 조회)
+        self._scroll_passthrough_viewports = frozenset((self.motion_list.viewport(), self.frame_preview.viewport(), self.timeline_scroll.viewport()))
 
     def _get_pressed_style_from_normal(self, normal_style_str, original_bg_color_key=None):
-        current_bg_hex = None
-        if original_bg_color_key and original_bg_color_key.upper() in DARKER_COLOR_MAP:
-            current_bg_hex = original_bg_color_key.upper()
-        else:
-            extracted_hex = CustomStyledButton._extract_background_color_hex(normal_style_str)
-            if extracted_hex:
-                current_bg_hex = extracted_hex.upper()
-
-        if current_bg_hex:
-            darker_bg_hex = DARKER_COLOR_MAP.get(current_bg_hex)
-            if darker_bg_hex:
-                return CustomStyledButton._replace_background_color_in_style(normal_style_str, darker_bg_hex)
-        return normal_style_str
+        return _pressed_style_from_normal_cached(normal_style_str, original_bg_color_key)
 
     def _init_playback_buttons(self):
         self.icon_base_path = "buttons"
         self.icon_size = QSize(20, 20)
         self.button_size = QSize(32, 32)
+        self._icon_cache_by_path = {}
 
         self.prev_btn = CustomStyledButton()
         self.prev_btn._icon_path_normal = os.path.join(self.icon_base_path, "3previous.png")
         self.prev_btn._icon_path_pressed = os.path.join(self.icon_base_path, "3previous_pressed.png")
-        self.prev_btn.setIcon(QIcon(self.prev_btn._icon_path_normal))
+        self.prev_btn._icon_normal = self._get_cached_icon(self.prev_btn._icon_path_normal)
+        self.prev_btn._icon_pressed = self._get_cached_icon(self.prev_btn._icon_path_pressed)
+        self.prev_btn.setIcon(self.prev_btn._icon_normal)
         self.prev_btn.setToolTip("이전 모션의 시작점으로 이동")
 
         self.play_pause_btn = CustomStyledButton()
@@ -325,13 +763,19 @@ class GifSplitterUI(QWidget):
         self.play_pause_btn._icon_path_pressed_off = os.path.join(self.icon_base_path, "1play_pressed.png")
         self.play_pause_btn._icon_path_normal_on = os.path.join(self.icon_base_path, "2stop.png")
         self.play_pause_btn._icon_path_pressed_on = os.path.join(self.icon_base_path, "2stop_pressed.png")
-        self.play_pause_btn.setIcon(QIcon(self.play_pause_btn._icon_path_normal_off))
+        self.play_pause_btn._icon_normal_off = self._get_cached_icon(self.play_pause_btn._icon_path_normal_off)
+        self.play_pause_btn._icon_pressed_off = self._get_cached_icon(self.play_pause_btn._icon_path_pressed_off)
+        self.play_pause_btn._icon_normal_on = self._get_cached_icon(self.play_pause_btn._icon_path_normal_on)
+        self.play_pause_btn._icon_pressed_on = self._get_cached_icon(self.play_pause_btn._icon_path_pressed_on)
+        self.play_pause_btn.setIcon(self.play_pause_btn._icon_normal_off)
         self.play_pause_btn.setToolTip("재생 (전체 반복)")
 
         self.next_btn = CustomStyledButton()
         self.next_btn._icon_path_normal = os.path.join(self.icon_base_path, "5next.png")
         self.next_btn._icon_path_pressed = os.path.join(self.icon_base_path, "5next_pressed.png")
-        self.next_btn.setIcon(QIcon(self.next_btn._icon_path_normal))
+        self.next_btn._icon_normal = self._get_cached_icon(self.next_btn._icon_path_normal)
+        self.next_btn._icon_pressed = self._get_cached_icon(self.next_btn._icon_path_pressed)
+        self.next_btn.setIcon(self.next_btn._icon_normal)
         self.next_btn.setToolTip("다음 모션의 시작점으로 이동")
 
         self.loop_btn = CustomStyledButton()
@@ -340,7 +784,11 @@ class GifSplitterUI(QWidget):
         self.loop_btn._icon_path_pressed_off = os.path.join(self.icon_base_path, "4loop_pressed.png")
         self.loop_btn._icon_path_normal_on = os.path.join(self.icon_base_path, "4loop_pressed.png")
         self.loop_btn._icon_path_pressed_on = os.path.join(self.icon_base_path, "4loop_pressed.png")
-        self.loop_btn.setIcon(QIcon(self.loop_btn._icon_path_normal_off))
+        self.loop_btn._icon_normal_off = self._get_cached_icon(self.loop_btn._icon_path_normal_off)
+        self.loop_btn._icon_pressed_off = self._get_cached_icon(self.loop_btn._icon_path_pressed_off)
+        self.loop_btn._icon_normal_on = self._get_cached_icon(self.loop_btn._icon_path_normal_on)
+        self.loop_btn._icon_pressed_on = self._get_cached_icon(self.loop_btn._icon_path_pressed_on)
+        self.loop_btn.setIcon(self.loop_btn._icon_normal_off)
         self.loop_btn.setToolTip("현재 모션 반복 (활성화 시)")
 
         self.playback_buttons_group = [
@@ -348,9 +796,7 @@ class GifSplitterUI(QWidget):
         ]
 
         normal_bg_key = "#3C3C3C"
-        base_playback_style_dict = {"border": "1px solid #2A2A2A", "border-radius": "5px", "padding": "0px"}
-
-        normal_style_str = self._generate_style_str_from_dict({**base_playback_style_dict, "background-color": normal_bg_key})
+        normal_style_str = _PLAYBACK_BTN_STYLE
         pressed_style_str = self._get_pressed_style_from_normal(normal_style_str, normal_bg_key)
 
         for btn in self.playback_buttons_group:
@@ -358,6 +804,25 @@ class GifSplitterUI(QWidget):
             btn.setFixedSize(self.button_size)
             btn.setCustomStyles(normal_style_str, pressed_style_str)
 
+        # (버튼, 체크 여부, 눌림 여부) -> 아이콘. 체크 불가 버튼은 isChecked()가 항상 False
+        self._playback_icon_table = {}
+        for btn in (self.prev_btn, self.next_btn):
+            self._playback_icon_table[(btn, False, False)] = btn._icon_normal
+            self._playback_icon_table[(btn, False, True)] = btn._icon_pressed
+        for btn in (self.play_pause_btn, self.loop_btn):
+            self._playback_icon_table[(btn, False, False)] = btn._icon_normal_off
+            self._playback_icon_table[(btn, False, True)] = btn._icon_pressed_off
+            self._playback_icon_table[(btn, True, False)] = btn._icon_normal_on
+            self._playback_icon_table[(btn, True, True)] = btn._icon_pressed_on
+
+    def _get_cached_icon(self, icon_path):
+        # 같은 경로의 아이콘은 QIcon 하나를 공유 (상태 전환마다 PNG 를 다시 읽지 않도록)
+        icon = self._icon_cache_by_path.get(icon_path)
+        if icon is None:
+            icon = QIcon(icon_path)
+            self._icon_cache_by_path[icon_path] = icon
+        return icon
+
     def _init_preview_control_buttons(self):
         preview_icon_size = QSize(30, 30)
         preview_button_size = QSize(48, 48)
@@ -388,6 +853,9 @@ class GifSplitterUI(QWidget):
             btn.setStyleSheet(button_style)
 
     def _get_status_font(self):
+        # 애플리케이션 폰트가 바뀔 때만 다시 생성 (eventFilter에서 무효화)
+        if self._status_font_cached is not None:
+            return self._status_font_cached
         font = QFont(QApplication.font())
         default_point_size = font.pointSize()
         if default_point_size <= 0:
@@ -397,15 +865,14 @@ class GifSplitterUI(QWidget):
             font.setPixelSize(int(default_pixel_size * 0.85))
         else:
             font.setPointSize(int(default_point_size * 0.85))
+        self._status_font_cached = font
         return font
 
     def _format_frame_number(self, frame_idx):
-        if frame_idx < 100:
-            return f"{frame_idx:02d}F"
-        elif frame_idx < 1000:
-            return f"{frame_idx:03d}F"
-        else:
-            return f"{frame_idx:04d}F"
+        # GIF 로드 시 미리 만들어 둔 라벨 사용, 범위를 벗어난 경우에만 직접 포맷
+        if 0 <= frame_idx < len(self._frame_label_cache):
+            return self._frame_label_cache[frame_idx]
+        return _format_frame_label(frame_idx)
 
     def init_ui(self):
         main_app_layout = QVBoxLayout()
@@ -451,9 +918,7 @@ class GifSplitterUI(QWidget):
         ]
 
         file_btn_original_bg_key = "#303030"
-        file_btn_style_attrs = {"color": "white", "border-radius": "5px", "padding": "0 10px"}
-
-        file_btn_normal_style = self._generate_style_str_from_dict({**file_btn_style_attrs, "background-color": file_btn_original_bg_key})
+        file_btn_normal_style = _FILE_BTN_STYLE
         file_btn_pressed_style = self._get_pressed_style_from_normal(file_btn_normal_style, file_btn_original_bg_key)
 
         for btn_top in file_project_buttons:
@@ -494,42 +959,15 @@ class GifSplitterUI(QWidget):
 
         content_area_layout.addLayout(top_bar_layout)
 
-        common_scrollbar_style = """
-            QScrollBar:horizontal {
-                height: 8px; background-color: #111111; margin: 0px; border-radius: 4px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #808080; min-width: 20px; border-radius: 4px;
-            }
-            QScrollBar::handle:horizontal:hover { background: #A0A0A0; }
-            QScrollBar::handle:horizontal:pressed { background: #606060; }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                background: none; border: none; width: 0px; height: 0px;
-            }
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal { background: #111111; }
-
-            QScrollBar:vertical {
-                width: 8px; background-color: #111111; margin: 0px; border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background: #808080; min-height: 20px; border-radius: 4px;
-            }
-            QScrollBar::handle:vertical:hover { background: #A0A0A0; }
-            QScrollBar::handle:vertical:pressed { background: #606060; }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                background: none; border: none; width: 0px; height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical { background: #111111; }
-        """
-
         self.timeline_layout = QHBoxLayout()
         self.timeline_layout.setSpacing(0)
         self.timeline_layout.setContentsMargins(0, 0, 0, 0)
         self.timeline_layout.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         self.timeline_layout.setSizeConstraint(QLayout.SetFixedSize)
         self.timeline_widget = QWidget()
+        self.timeline_widget.setObjectName("timeline_widget")
         self.timeline_widget.setLayout(self.timeline_layout)
-        self.timeline_widget.setStyleSheet("background-color: #202020; padding-top: 5px;")
+        self.timeline_widget.setStyleSheet(_TIMELINE_STYLE)
         self.timeline_widget.setMinimumHeight(36)
         self.timeline_widget.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
         self.timeline_scroll = QScrollArea()
@@ -538,12 +976,7 @@ class GifSplitterUI(QWidget):
         self.timeline_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.timeline_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.timeline_scroll.setWidget(self.timeline_widget)
-        self.timeline_scroll.setStyleSheet(f"""
-            QScrollArea {{ border: none; background-color: #202020; }}
-            QScrollArea::corner {{ background: #111111; }}
-            QScrollArea > QWidget {{ background-color: #202020; }}
-            {common_scrollbar_style}
-        """)
+        self.timeline_scroll.setObjectName("timeline_scroll")
         content_area_layout.addWidget(self.timeline_scroll)
 
         self.selected_frame_label = QLabel("선택 중인 프레임: -")
@@ -556,23 +989,11 @@ class GifSplitterUI(QWidget):
         self.primary_keyframe_btn = CustomStyledButton()
 
         self.motion_list = CustomMotionListWidget(self)
-        self.motion_list.setStyleSheet(f"""
-            QListWidget {{
-                background-color: #111111;
-                border: 1px solid #333;
-                border-radius: 5px;
-            }}
-            QListWidget::item {{
-                padding-top: 3px;
-                padding-bottom: 3px;
-                padding-left: 1px;
-                padding-right: 1px;
-            }}
-            QListWidget::item:selected {{ background-color: #4A4A70; }}
-            {common_scrollbar_style}
-        """)
+        self.motion_list.setObjectName("motion_list")
         self.motion_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
         self.motion_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.motion_list.setItemDelegate(MotionItemDelegate(self.motion_list))
+        self._event_handlers[self.motion_list.viewport()] = self._handle_motion_list_viewport_event
         self.motion_list.viewport().installEventFilter(self)
 
         left_panel = QVBoxLayout()
@@ -588,28 +1009,18 @@ class GifSplitterUI(QWidget):
 
         self.copy_desc_button = CustomStyledButton("내용 복사")
         self.copy_desc_button.setFixedHeight(24)
-        desc_btn_style_attrs = {"color": "white", "border-radius": "3px", "padding": "0 8px"}
-        desc_btn_normal_style = self._generate_style_str_from_dict({**desc_btn_style_attrs, "background-color": "#303030"})
+        desc_btn_normal_style = _DESC_BTN_STYLE
         desc_btn_pressed_style = self._get_pressed_style_from_normal(desc_btn_normal_style, "#303030")
         self.copy_desc_button.setCustomStyles(desc_btn_normal_style, desc_btn_pressed_style)
         center_panel_title_layout.addWidget(self.copy_desc_button)
 
-        self.frame_preview = QListWidget()
-        self.frame_preview.setStyleSheet(f"""
-            QListWidget {{
-                background-color: #111111; color: white;
-                border: 1px solid #333; border-radius: 5px;
-            }}
-            QListWidget::item {{
-                padding-top: 1px;
-                padding-bottom: 1px;
-                padding-left: 1px;
-                padding-right: 1px;
-            }}
-            {common_scrollbar_style}
-        """)
+        self.frame_preview_model = FramePreviewModel(self, self)
+        self.frame_preview = QListView()
+        self.frame_preview.setObjectName("frame_preview")
+        self.frame_preview.setModel(self.frame_preview_model)
         self.frame_preview.setTextElideMode(Qt.TextElideMode.ElideNone)
-        self.frame_preview.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
+        self.frame_preview.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self._event_handlers[self.frame_preview.viewport()] = self._handle_frame_preview_viewport_event
         self.frame_preview.viewport().installEventFilter(self)
 
         center_panel = QVBoxLayout()
@@ -617,7 +1028,7 @@ class GifSplitterUI(QWidget):
         center_panel.addWidget(self.frame_preview)
 
         self.graphics_scene = QGraphicsScene(self)
-        self.pixmap_item = QGraphicsPixmapItem()
+        self.pixmap_item = ExposedRectPixmapItem()
         self.graphics_scene.addItem(self.pixmap_item)
         self.graphics_view = QGraphicsView(self.graphics_scene, self)
 
@@ -632,6 +1043,15 @@ class GifSplitterUI(QWidget):
         self.graphics_view.setDragMode(QGraphicsView.ScrollHandDrag)
         self.graphics_view.setContextMenuPolicy(Qt.CustomContextMenu)
 
+        # 미리보기 우클릭 메뉴는 한 번만 만들어 두고, 표시할 때 체크 상태만 갱신
+        self._preview_menu = QMenu(self)
+        self._smooth_action = QAction("부드러운 필터 (Smooth)", self)
+        self._smooth_action.setCheckable(True)
+        self._preview_menu.addAction(self._smooth_action)
+        self._pixelated_action = QAction("픽셀 유지 필터 (Fast/Nearest)", self)
+        self._pixelated_action.setCheckable(True)
+        self._preview_menu.addAction(self._pixelated_action)
+
         self.preview_button_container = QWidget(self.graphics_view)
         preview_button_container_layout = QVBoxLayout(self.preview_button_container)
         preview_button_container_layout.setContentsMargins(2, 2, 2, 2)
@@ -668,16 +1088,11 @@ class GifSplitterUI(QWidget):
         self.export_txt_btn = CustomStyledButton("프레임설명 출력하기 (TXT)")
         self.export_all_btn = CustomStyledButton("모두 저장 (GIFs + TXT)")
 
+        # 추출 버튼 스타일은 메인 창 스타일시트의 #exportBtn 규칙으로 적용 (버튼별 스타일시트 파싱 없음)
         button_height = 47
-        export_btn_original_bg_key = "#303030"
-        export_btn_style_attrs = {"color": "white", "border-radius": "5px", "padding": "0 15px"}
-
-        export_btn_normal_style = self._generate_style_str_from_dict({**export_btn_style_attrs, "background-color": export_btn_original_bg_key})
-        export_btn_pressed_style = self._get_pressed_style_from_normal(export_btn_normal_style, export_btn_original_bg_key)
-
-        for b_export in [self.export_gif_btn, self.export_txt_btn, self.export_all_btn]:
+        for b_export in (self.export_gif_btn, self.export_txt_btn, self.export_all_btn):
+            b_export.setObjectName("exportBtn")
             b_export.setFixedHeight(button_height)
-            b_export.setCustomStyles(export_btn_normal_style, export_btn_pressed_style)
             b_export.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         bottom_bar = QHBoxLayout()
         bottom_bar.setContentsMargins(0, 5, 0, 5)
@@ -692,6 +1107,10 @@ class GifSplitterUI(QWidget):
 
         self.setLayout(main_app_layout)
 
+    def _on_frame_button_clicked(self):
+        # 모든 프레임 버튼이 공유하는 슬롯 - 버튼별 람다 대신 FrameButton.index 사용
+        self.select_frame(self.sender().index)
+
     def handle_frame_button_double_click(self, frame_index):
         if self.selected_index != frame_index:
             self.select_frame(frame_index)
@@ -709,15 +1128,6 @@ class GifSplitterUI(QWidget):
 
         new_name, ok = QInputDialog.getText(self, dialog_title, prompt_label, QLineEdit.EchoMode.Normal, current_motion_name)
 
-        def delayed_style_reset_for_frame_button():
-            if 0 <= frame_index < len(self.frame_buttons):
-                button_instance = self.frame_buttons[frame_index]
-                if isinstance(button_instance, FrameButton):
-                    self.update_frame_button_styles()
-                    button_instance.update()
-
-        QTimer.singleShot(0, delayed_style_reset_for_frame_button)
-
         if ok:
             new_name_stripped = new_name.strip()
             if not new_name_stripped:
@@ -729,6 +1139,7 @@ class GifSplitterUI(QWidget):
                 return
 
             self.keyframes[frame_index] = new_name_stripped
+            self._sorted_keyframes_cache = None
             self.unsaved_changes = True
             self.update_frame_button_styles()
             self.refresh_motion_list()
@@ -741,7 +1152,29 @@ class GifSplitterUI(QWidget):
         else:
             self._update_status(f"프레임 {frame_index + 1} 키프레임 등록/수정 취소됨.")
 
-    def _update_status(self, message, is_loading=False, is_complete_success=False):
+    def _update_status(self, message, is_loading=False, is_complete_success=False, force=False):
+        if force:
+            # 곧바로 UI를 막는 작업이 이어지는 경우 등은 대기 중인 갱신을 버리고 즉시 반영
+            self._status_debounce.stop()
+            self._pending_status = None
+            self._apply_status(message, is_loading, is_complete_success)
+            return
+        self._pending_status = (message, is_loading, is_complete_success)
+        self._status_debounce.start()
+
+    def _flush_pending_status(self):
+        if self._pending_status is not None:
+            pending_status = self._pending_status
+            self._pending_status = None
+            self._apply_status(*pending_status)
+
+    def _apply_status(self, message, is_loading, is_complete_success):
+        status = (message, is_loading, is_complete_success)
+        # 완료 표시는 1초 타이머를 다시 시작해야 하므로 같은 상태여도 적용
+        if status == self._applied_status and not is_complete_success:
+            return
+        self._applied_status = status
+
         self._status_timer.stop()
         self.status_label.setText(message)
         self._current_status_message_for_timer = message
@@ -755,13 +1188,18 @@ class GifSplitterUI(QWidget):
         else:
             current_style = self.status_label_default_style
 
-        self.status_label.setStyleSheet(current_style)
-        QApplication.processEvents()
+        self._set_status_style(current_style)
+
+    def _set_status_style(self, style):
+        # 스타일시트는 같은 문자열이어도 다시 파싱/polish 되므로 바뀔 때만 적용
+        if style != self._applied_status_style:
+            self._applied_status_style = style
+            self.status_label.setStyleSheet(style)
 
     def _clear_status_loading_style(self):
         self.status_label.setText(self._current_status_message_for_timer)
-        self.status_label.setStyleSheet(self.status_label_default_style)
-        QApplication.processEvents()
+        self._set_status_style(self.status_label_default_style)
+        self._applied_status = (self._current_status_message_for_timer, False, False)
 
     def connect_signals(self):
         self.new_project_btn.clicked.connect(lambda: self.start_new_project(show_message=True))
@@ -772,7 +1210,7 @@ class GifSplitterUI(QWidget):
         self.primary_keyframe_btn.clicked.connect(self._on_primary_keyframe_button_clicked)
 
         self.motion_list.itemPressed.connect(self.on_motion_list_item_pressed)
-        self.frame_preview.itemPressed.connect(self.on_frame_preview_item_pressed)
+        self.frame_preview.pressed.connect(self.on_frame_preview_item_pressed)
         if hasattr(self, 'copy_desc_button'):
             self.copy_desc_button.clicked.connect(self._copy_all_frame_descriptions_to_clipboard)
 
@@ -782,21 +1220,21 @@ class GifSplitterUI(QWidget):
 
         self.playback_timer.timeout.connect(self._advance_frame)
 
-        self.prev_btn.pressed.connect(partial(self._on_playback_button_pressed, self.prev_btn))
-        self.prev_btn.released.connect(partial(self._on_playback_button_released, self.prev_btn))
+        self.prev_btn.pressed.connect(self._on_playback_button_pressed)
+        self.prev_btn.released.connect(self._on_playback_button_released)
         self.prev_btn.clicked.connect(self._on_prev_keyframe_clicked)
 
         self.play_pause_btn.toggled.connect(self._on_play_pause_toggled)
-        self.play_pause_btn.pressed.connect(partial(self._on_playback_button_pressed, self.play_pause_btn))
-        self.play_pause_btn.released.connect(partial(self._on_playback_button_released, self.play_pause_btn))
+        self.play_pause_btn.pressed.connect(self._on_playback_button_pressed)
+        self.play_pause_btn.released.connect(self._on_playback_button_released)
 
-        self.next_btn.pressed.connect(partial(self._on_playback_button_pressed, self.next_btn))
-        self.next_btn.released.connect(partial(self._on_playback_button_released, self.next_btn))
+        self.next_btn.pressed.connect(self._on_playback_button_pressed)
+        self.next_btn.released.connect(self._on_playback_button_released)
         self.next_btn.clicked.connect(self._on_next_keyframe_clicked)
 
         self.loop_btn.toggled.connect(self._on_loop_toggled)
-        self.loop_btn.pressed.connect(partial(self._on_playback_button_pressed, self.loop_btn))
-        self.loop_btn.released.connect(partial(self._on_playback_button_released, self.loop_btn))
+        self.loop_btn.pressed.connect(self._on_playback_button_pressed)
+        self.loop_btn.released.connect(self._on_playback_button_released)
 
         if self.preview_zoom_in_btn:
             self.preview_zoom_in_btn.clicked.connect(lambda: self._change_preview_scale(1))
@@ -807,44 +1245,30 @@ class GifSplitterUI(QWidget):
 
         if self.graphics_view:
             self.graphics_view.customContextMenuRequested.connect(self._show_preview_context_menu)
+        self._smooth_action.triggered.connect(partial(self._set_preview_transformation_mode, Qt.TransformationMode.SmoothTransformation))
+        self._pixelated_action.triggered.connect(partial(self._set_preview_transformation_mode, Qt.TransformationMode.FastTransformation))
 
     def _show_preview_context_menu(self, position):
         if not self.all_frame_data:
             return
 
-        menu = QMenu(self)
-
-        smooth_action = QAction("부드러운 필터 (Smooth)", self)
-        smooth_action.setCheckable(True)
-        smooth_action.setChecked(self.current_transformation_mode == Qt.TransformationMode.SmoothTransformation)
-        smooth_action.triggered.connect(lambda: self._set_preview_transformation_mode(Qt.TransformationMode.SmoothTransformation))
-        menu.addAction(smooth_action)
-
-        pixelated_action = QAction("픽셀 유지 필터 (Fast/Nearest)", self)
-        pixelated_action.setCheckable(True)
-        pixelated_action.setChecked(self.current_transformation_mode == Qt.TransformationMode.FastTransformation)
-        pixelated_action.triggered.connect(lambda: self._set_preview_transformation_mode(Qt.TransformationMode.FastTransformation))
-        menu.addAction(pixelated_action)
-
-        menu.exec_(self.graphics_view.viewport().mapToGlobal(position))
+        self._smooth_action.setChecked(self.current_transformation_mode == Qt.TransformationMode.SmoothTransformation)
+        self._pixelated_action.setChecked(self.current_transformation_mode == Qt.TransformationMode.FastTransformation)
+        self._preview_menu.exec_(self.graphics_view.viewport().mapToGlobal(position))
 
     def on_motion_list_item_pressed(self, item):
         self.pressed_motion_list_item = item
 
-    def on_frame_preview_item_pressed(self, item):
-        self.pressed_frame_preview_item = item
+    def on_frame_preview_item_pressed(self, index):
+        self.pressed_frame_preview_item = index.row()
 
     def _update_primary_keyframe_button_ui(self):
         if self.selected_index is not None and self.selected_index in self.keyframes:
             self.primary_keyframe_btn.setText("키프레임 해제/모션삭제")
-            normal_style = self.remove_keyframe_style
-            pressed_style = self._get_pressed_style_from_normal(normal_style, "#F44336")
-            self.primary_keyframe_btn.setCustomStyles(normal_style, pressed_style)
+            self.primary_keyframe_btn.setCustomStyles(self.remove_keyframe_style, self._remove_kf_pressed_style)
         else:
             self.primary_keyframe_btn.setText("키프레임 설정/모션등록")
-            normal_style = self.add_keyframe_style
-            pressed_style = self._get_pressed_style_from_normal(normal_style, "#4CAF50")
-            self.primary_keyframe_btn.setCustomStyles(normal_style, pressed_style)
+            self.primary_keyframe_btn.setCustomStyles(self.add_keyframe_style, self._add_kf_pressed_style)
 
     def _on_primary_keyframe_button_clicked(self):
         if self.selected_index is not None and self.selected_index in self.keyframes:
@@ -856,30 +1280,51 @@ class GifSplitterUI(QWidget):
         if not self.keyframes or frame_index is None:
             return None, None
 
-        sorted_keys = sorted(self.keyframes.keys())
+        if 0 <= frame_index <= self._last_frame_idx:
+            motion_starts, motion_ends = self._get_motion_map()
+            end = motion_ends[frame_index]
+            if end == -1:
+                return None, None
+            return motion_starts[frame_index], end
 
-        current_motion_start_key = None
-        for k_start in sorted_keys:
-            if k_start <= frame_index:
-                current_motion_start_key = k_start
-            else:
-                break
+        sorted_keys = self._get_sorted_keys()
 
-        if current_motion_start_key is None:
+        # frame_index 이하인 마지막 키프레임 위치
+        i = bisect.bisect_right(sorted_keys, frame_index) - 1
+        if i < 0:
             return None, None
 
-        try:
-            current_motion_start_key_idx_in_sorted = sorted_keys.index(current_motion_start_key)
-            k_end = sorted_keys[current_motion_start_key_idx_in_sorted + 1] - 1 \
-                if current_motion_start_key_idx_in_sorted + 1 < len(sorted_keys) \
-                else len(self.all_frame_data) - 1
-
-            if current_motion_start_key <= frame_index <= k_end:
-                 return current_motion_start_key, k_end
-            else:
-                 return None, None
-        except ValueError:
+        start = sorted_keys[i]
+        end = sorted_keys[i + 1] - 1 if i + 1 < len(sorted_keys) else self._last_frame_idx
+        if frame_index > end:
             return None, None
+        return start, end
+
+    def _get_sorted_keys(self):
+        if self._sorted_keyframes_cache is None:
+            self._sorted_keyframes_cache = sorted(self.keyframes)
+        return self._sorted_keyframes_cache
+
+    def _get_motion_map(self):
+        # 프레임 인덱스 -> 소속 모션의 (시작 키, 끝 프레임), 모션 밖이면 끝 프레임이 -1
+        sorted_keys = self._get_sorted_keys()
+        frame_count = self._last_frame_idx + 1
+        cache = self._motion_map_cache
+        if cache is not None and cache[0] is sorted_keys and len(cache[1]) == frame_count:
+            return cache[1], cache[2]
+
+        motion_starts = array('i', [-1]) * frame_count
+        motion_ends = array('i', [-1]) * frame_count
+        for k_idx, start_frame in enumerate(sorted_keys):
+            if start_frame > self._last_frame_idx:
+                break
+            end_frame = sorted_keys[k_idx + 1] - 1 if k_idx + 1 < len(sorted_keys) else self._last_frame_idx
+            lo, hi = max(start_frame, 0), min(end_frame, self._last_frame_idx) + 1
+            if lo < hi:
+                motion_starts[lo:hi] = array('i', [start_frame]) * (hi - lo)
+                motion_ends[lo:hi] = array('i', [end_frame]) * (hi - lo)
+        self._motion_map_cache = (sorted_keys, motion_starts, motion_ends)
+        return motion_starts, motion_ends
 
     def _get_current_motion_start_key(self, frame_index, sorted_keys):
         if not sorted_keys:
@@ -893,16 +1338,11 @@ class GifSplitterUI(QWidget):
             return None
 
         current_motion_start = sorted_keys[insert_point - 1]
-
-        start_key_idx_in_list = -1
-        try:
-            start_key_idx_in_list = sorted_keys.index(current_motion_start)
-        except ValueError:
-            return None
+        start_key_idx_in_list = insert_point - 1 # bisect 결과로 위치를 이미 알고 있으므로 index() 탐색 불필요
 
         end_frame_of_current_motion = sorted_keys[start_key_idx_in_list + 1] - 1 \
             if start_key_idx_in_list + 1 < len(sorted_keys) \
-            else len(self.all_frame_data) - 1
+            else self._last_frame_idx
 
         if current_motion_start <= frame_index <= end_frame_of_current_motion:
             return current_motion_start
@@ -918,9 +1358,10 @@ class GifSplitterUI(QWidget):
     def _update_playback_context_and_resume(self, new_target_frame):
         self.current_playback_frame_index = new_target_frame
 
-        if not self.play_pause_btn.isChecked():
+        # toggled 시그널로 _on_play_pause_toggled가 다시 이 함수를 부르지 않도록 차단
+        with QSignalBlocker(self.play_pause_btn):
             self.play_pause_btn.setChecked(True)
-        self.play_pause_btn.setIcon(QIcon(self.play_pause_btn._icon_path_normal_on))
+        self.play_pause_btn.setIcon(self.play_pause_btn._icon_normal_on)
 
         status_msg = ""
 
@@ -973,10 +1414,14 @@ class GifSplitterUI(QWidget):
             self.select_frame(self.current_playback_frame_index, _internal_call_maintains_play_state=False)
 
             self._update_playback_context_and_resume(self.current_playback_frame_index)
-            self.play_pause_btn.setIcon(QIcon(self.play_pause_btn._icon_path_normal_on))
+            self.play_pause_btn.setIcon(self.play_pause_btn._icon_normal_on)
         else:
             self.playback_timer.stop()
-            self.play_pause_btn.setIcon(QIcon(self.play_pause_btn._icon_path_normal_off))
+            if self._playback_ui_sync_timer.isActive():
+                # 일시정지한 프레임이 선택 상태로 보이도록 대기 중인 UI 동기화를 바로 적용
+                self._playback_ui_sync_timer.stop()
+                self._sync_playback_ui()
+            self.play_pause_btn.setIcon(self.play_pause_btn._icon_normal_off)
             if self.loop_btn.isChecked():
                  self.play_pause_btn.setToolTip("현재 모션 반복 재생")
             else:
@@ -988,39 +1433,56 @@ class GifSplitterUI(QWidget):
             self._stop_playback_and_reset_ui()
             return
 
-        next_frame_index = self.current_playback_frame_index + 1
-
-        if self.is_looping_specific_motion and self.loop_btn.isChecked():
-            if next_frame_index > self.active_motion_end_index:
-                self.current_playback_frame_index = self.active_motion_start_index
-            else:
-                self.current_playback_frame_index = next_frame_index
-        else:
-            if next_frame_index >= len(self.all_frame_data):
-                self.current_playback_frame_index = 0
-            else:
-                self.current_playback_frame_index = next_frame_index
+        self.current_playback_frame_index = self._next_playback_frame_index(self.current_playback_frame_index)
 
-        self.select_frame(self.current_playback_frame_index, _internal_call_maintains_play_state=True)
+        if self.pixmap_item:
+            self.pixmap_item.setPixmap(self._get_frame_pixmap(self.current_playback_frame_index))
+        if not self._playback_ui_sync_timer.isActive():
+            self._playback_ui_sync_timer.start()
 
         delay = self.all_frame_data[self.current_playback_frame_index]['delay']
         if delay <= 0: delay = 100
         self.playback_timer.start(delay)
 
+        # 다음 프레임 픽스맵은 현재 프레임이 그려진 뒤 대기 시간 동안 미리 준비
+        QTimer.singleShot(0, partial(self._prefetch_frame_pixmap, self._next_playback_frame_index(self.current_playback_frame_index)))
+
+    def _sync_playback_ui(self):
+        if 0 <= self.current_playback_frame_index <= self._last_frame_idx:
+            self.select_frame(self.current_playback_frame_index, _internal_call_maintains_play_state=True)
+
+    def _next_playback_frame_index(self, current_index):
+        next_frame_index = current_index + 1
+
+        if self.is_looping_specific_motion and self.loop_btn.isChecked():
+            if next_frame_index > self.active_motion_end_index:
+                return self.active_motion_start_index
+            return next_frame_index
+        if next_frame_index > self._last_frame_idx:
+            return 0
+        return next_frame_index
+
+    def _prefetch_frame_pixmap(self, index):
+        if self.playback_timer.isActive() and 0 <= index <= self._last_frame_idx:
+            self._get_frame_pixmap(index)
+
     def _stop_playback_and_reset_ui(self):
         self.playback_timer.stop()
-        if self.play_pause_btn.isChecked():
+        self._playback_ui_sync_timer.stop()
+        was_checked = self.play_pause_btn.isChecked()
+        with QSignalBlocker(self.play_pause_btn):
             self.play_pause_btn.setChecked(False)
+        self.play_pause_btn.setIcon(self.play_pause_btn._icon_normal_off)
+        if self.loop_btn.isChecked():
+             self.play_pause_btn.setToolTip("현재 모션 반복 재생")
         else:
-            self.play_pause_btn.setIcon(QIcon(self.play_pause_btn._icon_path_normal_off))
-            if self.loop_btn.isChecked():
-                 self.play_pause_btn.setToolTip("현재 모션 반복 재생")
-            else:
-                 self.play_pause_btn.setToolTip("재생 (전체 반복)")
+             self.play_pause_btn.setToolTip("재생 (전체 반복)")
+        if was_checked:
+            self._update_status("재생 일시정지됨.")
 
     def _on_loop_toggled(self, checked):
         if checked:
-            self.loop_btn.setIcon(QIcon(self.loop_btn._icon_path_normal_on))
+            self.loop_btn.setIcon(self.loop_btn._icon_normal_on)
             self.loop_btn.setToolTip("현재 모션 반복 (활성화)")
             self._update_status("모션 반복 활성화됨.")
             if self.playback_timer.isActive():
@@ -1029,7 +1491,7 @@ class GifSplitterUI(QWidget):
                  self.play_pause_btn.setToolTip("현재 모션 반복 재생")
 
         else:
-            self.loop_btn.setIcon(QIcon(self.loop_btn._icon_path_normal_off))
+            self.loop_btn.setIcon(self.loop_btn._icon_normal_off)
             self.loop_btn.setToolTip("현재 모션 반복 (비활성화)")
             self._update_status("모션 반복 비활성화됨.")
             self.is_looping_specific_motion = False
@@ -1039,55 +1501,12 @@ class GifSplitterUI(QWidget):
                  self.play_pause_btn.setToolTip("재생 (전체 반복)")
 
     def _on_prev_keyframe_clicked(self):
-        if not self.all_frame_data or not self.keyframes:
-            self._update_status("등록된 키프레임이 없거나 GIF가 로드되지 않았습니다.")
-            if self.playback_timer.isActive(): self._stop_playback_and_reset_ui()
-            return
-
-        was_playing = self.playback_timer.isActive()
-        if was_playing:
-            self.playback_timer.stop()
-
-        sorted_keys = sorted(self.keyframes.keys())
-        current_selected_or_playback_idx = self.current_playback_frame_index if was_playing else \
-                                           (self.selected_index if self.selected_index is not None else 0)
-
-        current_motion_start_key = self._get_current_motion_start_key(current_selected_or_playback_idx, sorted_keys)
-
-        new_target_frame = -1
-        target_motion_name = "알 수 없는 모션"
-
-        if not sorted_keys:
-            if was_playing: self._stop_playback_and_reset_ui()
-            self._update_status("등록된 키프레임이 없습니다.")
-            return
-
-        if current_motion_start_key is None :
-            new_target_frame = sorted_keys[-1]
-        else:
-            try:
-                idx_in_sorted = sorted_keys.index(current_motion_start_key)
-                target_key_idx_in_sorted = idx_in_sorted - 1
-                if target_key_idx_in_sorted < 0:
-                    target_key_idx_in_sorted = len(sorted_keys) - 1
-                new_target_frame = sorted_keys[target_key_idx_in_sorted]
-            except ValueError:
-                 new_target_frame = sorted_keys[-1]
-
-        if new_target_frame != -1:
-            target_motion_name = self.keyframes.get(new_target_frame, "알 수 없는 모션")
-            self.select_frame(new_target_frame, _internal_call_maintains_play_state=was_playing)
-
-            if was_playing:
-                self._update_playback_context_and_resume(new_target_frame)
-            else:
-                self._update_status(f"이전 모션 '{target_motion_name}' ({new_target_frame + 1}F)으로 이동.")
-                self.current_playback_frame_index = new_target_frame
-        else:
-            if was_playing: self._stop_playback_and_reset_ui()
-            self._update_status("이전 모션을 찾을 수 없습니다.")
+        self._navigate_keyframe(-1)
 
     def _on_next_keyframe_clicked(self):
+        self._navigate_keyframe(+1)
+
+    def _navigate_keyframe(self, direction):
         if not self.all_frame_data or not self.keyframes:
             self._update_status("등록된 키프레임이 없거나 GIF가 로드되지 않았습니다.")
             if self.playback_timer.isActive(): self._stop_playback_and_reset_ui()
@@ -1097,72 +1516,35 @@ class GifSplitterUI(QWidget):
         if was_playing:
             self.playback_timer.stop()
 
-        sorted_keys = sorted(self.keyframes.keys())
+        sorted_keys = self._get_sorted_keys()
         current_selected_or_playback_idx = self.current_playback_frame_index if was_playing else \
                                            (self.selected_index if self.selected_index is not None else 0)
 
         current_motion_start_key = self._get_current_motion_start_key(current_selected_or_playback_idx, sorted_keys)
 
-        new_target_frame = -1
-        target_motion_name = "알 수 없는 모션"
-
-        if not sorted_keys:
-            if was_playing: self._stop_playback_and_reset_ui()
-            self._update_status("등록된 키프레임이 없습니다.")
-            return
-
         if current_motion_start_key is None:
-            new_target_frame = sorted_keys[0]
+            new_target_frame = sorted_keys[-1 if direction < 0 else 0]
         else:
-            try:
-                idx_in_sorted = sorted_keys.index(current_motion_start_key)
-                target_key_idx_in_sorted = idx_in_sorted + 1
-                if target_key_idx_in_sorted >= len(sorted_keys):
-                    target_key_idx_in_sorted = 0
-                new_target_frame = sorted_keys[target_key_idx_in_sorted]
-            except ValueError:
-                new_target_frame = sorted_keys[0]
-
-        if new_target_frame != -1:
-            target_motion_name = self.keyframes.get(new_target_frame, "알 수 없는 모션")
-            self.select_frame(new_target_frame, _internal_call_maintains_play_state=was_playing)
-
-            if was_playing:
-                self._update_playback_context_and_resume(new_target_frame)
-            else:
-                self._update_status(f"다음 모션 '{target_motion_name}' ({new_target_frame + 1}F)으로 이동.")
-                self.current_playback_frame_index = new_target_frame
+            idx_in_sorted = bisect.bisect_left(sorted_keys, current_motion_start_key)
+            new_target_frame = sorted_keys[(idx_in_sorted + direction) % len(sorted_keys)] # 처음/끝에서 반대쪽으로 순환
+
+        target_motion_name = self.keyframes.get(new_target_frame, "알 수 없는 모션")
+        self.select_frame(new_target_frame, _internal_call_maintains_play_state=was_playing)
+
+        if was_playing:
+            self._update_playback_context_and_resume(new_target_frame)
         else:
-            if was_playing: self._stop_playback_and_reset_ui()
-            self._update_status("다음 모션을 찾을 수 없습니다.")
+            direction_label = "이전" if direction < 0 else "다음"
+            self._update_status(f"{direction_label} 모션 '{target_motion_name}' ({new_target_frame + 1}F)으로 이동.")
+            self.current_playback_frame_index = new_target_frame
 
-    def _on_playback_button_pressed(self, button):
-        if button == self.play_pause_btn:
-            if button.isChecked():
-                button.setIcon(QIcon(button._icon_path_pressed_on))
-            else:
-                button.setIcon(QIcon(button._icon_path_pressed_off))
-        elif button == self.loop_btn:
-            if button.isChecked():
-                button.setIcon(QIcon(button._icon_path_pressed_on))
-            else:
-                button.setIcon(QIcon(button._icon_path_pressed_off))
-        elif hasattr(button, '_icon_path_pressed'):
-            button.setIcon(QIcon(button._icon_path_pressed))
-
-    def _on_playback_button_released(self, button):
-        if button == self.play_pause_btn:
-            if button.isChecked():
-                button.setIcon(QIcon(button._icon_path_normal_on))
-            else:
-                button.setIcon(QIcon(button._icon_path_normal_off))
-        elif button == self.loop_btn:
-            if button.isChecked():
-                button.setIcon(QIcon(button._icon_path_normal_on))
-            else:
-                button.setIcon(QIcon(button._icon_path_normal_off))
-        elif hasattr(button, '_icon_path_normal'):
-            button.setIcon(QIcon(button._icon_path_normal))
+    def _on_playback_button_pressed(self):
+        button = self.sender()
+        button.setIcon(self._playback_icon_table[(button, button.isChecked(), True)])
+
+    def _on_playback_button_released(self):
+        button = self.sender()
+        button.setIcon(self._playback_icon_table[(button, button.isChecked(), False)])
 
     def _apply_current_scale(self):
         if self.graphics_view and self.pixmap_item and not self.pixmap_item.pixmap().isNull():
@@ -1197,6 +1579,21 @@ class GifSplitterUI(QWidget):
             self._update_status(f"최대 배율({self.scale_levels[-1]:.2f}x)입니다.")
         self._update_preview_button_states()
 
+    def _flush_wheel_zoom(self):
+        steps = int(self._wheel_accum / 120) # 0 방향으로 버림, 남은 delta는 다음 입력에 이어서 누적
+        self._wheel_accum -= steps * 120
+        if steps == 0:
+            return
+        # 누적된 단계가 범위를 넘으면 끝 배율까지만 이동 (이미 끝이면 한 단계 요청으로 안내 메시지 표시)
+        clamped_steps = max(-self.current_scale_index, min(steps, len(self.scale_levels) - 1 - self.current_scale_index))
+        self._change_preview_scale(clamped_steps if clamped_steps else (1 if steps > 0 else -1))
+
+    def _flush_wheel_select(self):
+        index = self._pending_wheel_index
+        self._pending_wheel_index = None
+        if index is not None:
+            self.select_frame(index)
+
     def _set_preview_transformation_mode(self, mode):
         if self.current_transformation_mode != mode:
             self.current_transformation_mode = mode
@@ -1217,10 +1614,7 @@ class GifSplitterUI(QWidget):
             self._update_status("초기화할 미리보기 내용이 없습니다.")
             return
 
-        try:
-            self.current_scale_index = self.scale_levels.index(1.0)
-        except ValueError:
-            self.current_scale_index = min(range(len(self.scale_levels)), key=lambda i: abs(self.scale_levels[i]-1.0))
+        self.current_scale_index = _SCALE_DEFAULT_INDEX
         self.current_scale_factor = self.scale_levels[self.current_scale_index]
 
         self.graphics_view.resetTransform()
@@ -1235,6 +1629,11 @@ class GifSplitterUI(QWidget):
     def ensure_frame_visible(self, index):
         if self.frame_buttons and 0 <= index < len(self.frame_buttons):
             widget_to_show = self.frame_buttons[index]
+            viewport = self.timeline_scroll.viewport()
+            # 여백(50px)까지 이미 보이는 경우(재생 중 대부분)는 스크롤 계산 생략
+            widget_rect = QRect(widget_to_show.mapTo(viewport, QPoint(0, 0)), widget_to_show.size())
+            if viewport.rect().contains(widget_rect.adjusted(-50, 0, 50, 0)):
+                return
             self.timeline_scroll.ensureWidgetVisible(widget_to_show, 50, 0)
 
     def _is_view_panned(self, tolerance=1e-5):
@@ -1267,104 +1666,105 @@ class GifSplitterUI(QWidget):
         self.preview_zoom_out_btn.setEnabled(can_zoom_out)
 
         is_scaled_not_default = not math.isclose(self.current_scale_factor, 1.0, abs_tol=1e-9)
-        is_panned = False
-        if self.pixmap_item and self.pixmap_item.pixmap() and not self.pixmap_item.pixmap().isNull() and self.pixmap_item.scene():
-            is_panned = self._is_view_panned()
-
-        can_go_home = is_scaled_not_default or is_panned
+        # 배율이 기본값이 아니면 홈 버튼은 이미 활성 - 팬 여부 좌표 계산은 배율이 1.0일 때만 수행
+        can_go_home = is_scaled_not_default or self._is_view_panned()
         self.preview_home_btn.setEnabled(can_go_home)
 
     def eventFilter(self, watched_object, event):
-        if watched_object == self.graphics_view.viewport():
-            if event.type() == QEvent.Type.Wheel:
-                if self.all_frame_data:
-                    delta = event.angleDelta().y()
-                    if delta < 0:
-                        self._change_preview_scale(-1)
-                    elif delta > 0:
-                        self._change_preview_scale(1)
-                    return True
-                else:
-                    return False
-            elif event.type() == QEvent.Type.MouseButtonRelease:
-                if event.button() == Qt.MouseButton.LeftButton:
-                    self._update_preview_button_states()
-                return False
+        handler = self._event_handlers.get(watched_object)
+        if handler is not None:
+            return handler(watched_object, event)
+        return super().eventFilter(watched_object, event)
 
-        if watched_object == self:
-            if event.type() == QEvent.Type.Wheel:
-                widget_under_mouse = QApplication.widgetAt(event.globalPosition().toPoint())
+    def _handle_preview_viewport_event(self, watched_object, event):
+        if event.type() == QEvent.Type.Wheel:
+            if self.all_frame_data:
+                self._wheel_accum += event.angleDelta().y()
+                self._wheel_timer.start()
+                return True
+            else:
+                return False
+        elif event.type() == QEvent.Type.MouseButtonRelease:
+            if event.button() == Qt.MouseButton.LeftButton:
+                self._update_preview_button_states()
+            return False
+        return super().eventFilter(watched_object, event)
 
-                current_widget = widget_under_mouse
-                is_graphics_view_child = False
-                while current_widget:
-                    if current_widget == self.graphics_view:
-                        is_graphics_view_child = True
-                        break
-                    current_widget = current_widget.parent()
+    def _handle_window_event(self, watched_object, event):
+        if event.type() == QEvent.Type.ApplicationFontChange:
+            self._status_font_cached = None
+            return False
+        if event.type() == QEvent.Type.Wheel:
+            widget_under_mouse = QApplication.widgetAt(event.globalPosition().toPoint())
 
-                if is_graphics_view_child:
-                    return False
+            if widget_under_mouse is not None and self.graphics_view and \
+               (widget_under_mouse is self.graphics_view or self.graphics_view.isAncestorOf(widget_under_mouse)):
+                return False
 
-                if isinstance(widget_under_mouse, QLineEdit) or \
-                   (hasattr(widget_under_mouse, 'viewport') and
-                    (widget_under_mouse.viewport() == self.motion_list.viewport() or
-                     widget_under_mouse.viewport() == self.frame_preview.viewport() or
-                     widget_under_mouse.viewport() == self.timeline_scroll.viewport())):
-                    return super().eventFilter(watched_object, event)
+            if isinstance(widget_under_mouse, QLineEdit) or \
+               (hasattr(widget_under_mouse, 'viewport') and widget_under_mouse.viewport() in self._scroll_passthrough_viewports):
+                return super().eventFilter(watched_object, event)
 
-                if self.all_frame_data:
+            if self.all_frame_data:
+                if self._pending_wheel_index is not None:
+                    current_idx = self._pending_wheel_index
+                else:
                     current_idx = self.selected_index if self.selected_index is not None else 0
-                    new_index = current_idx
-                    delta = event.angleDelta().y()
-                    if delta < 0:
-                        if current_idx < len(self.all_frame_data) - 1: new_index = current_idx + 1
-                    elif delta > 0:
-                        if current_idx > 0: new_index = current_idx - 1
-                    if new_index != current_idx: self.select_frame(new_index)
-                    return True
-
-        if event.type() == QEvent.Type.MouseButtonRelease:
-            if event.button() == Qt.MouseButton.LeftButton:
-                if watched_object == self.motion_list.viewport():
-                    if self.pressed_motion_list_item:
-                        released_item = self.motion_list.itemAt(event.position().toPoint())
-                        if released_item == self.pressed_motion_list_item:
-                            frame_index_data = released_item.data(Qt.UserRole)
-                            if frame_index_data is not None:
-                                try:
-                                    frame_index = int(frame_index_data)
-                                    if 0 <= frame_index < len(self.all_frame_data):
-                                        self.select_frame(frame_index)
-                                except ValueError:
-                                    pass
-                        self.pressed_motion_list_item = None
-                    return True
-
-                elif watched_object == self.frame_preview.viewport():
-                    if self.pressed_frame_preview_item:
-                        released_item = self.frame_preview.itemAt(event.position().toPoint())
-                        if released_item == self.pressed_frame_preview_item:
-                            frame_index_data = released_item.data(Qt.UserRole)
-                            if frame_index_data is not None and frame_index_data != -1:
-                                try:
-                                    frame_index = int(frame_index_data)
-                                    if frame_index >= 0 and frame_index < len(self.all_frame_data):
-                                        self.select_frame(frame_index)
-                                except ValueError:
-                                    pass
-                        self.pressed_frame_preview_item = None
-                    return True
+                new_index = current_idx
+                delta = event.angleDelta().y()
+                if delta < 0:
+                    if current_idx < self._last_frame_idx: new_index = current_idx + 1
+                elif delta > 0:
+                    if current_idx > 0: new_index = current_idx - 1
+                if new_index != current_idx:
+                    self._pending_wheel_index = new_index
+                    self._wheel_select_timer.start()
+                return True
 
         return super().eventFilter(watched_object, event)
 
+    def _handle_motion_list_viewport_event(self, watched_object, event):
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            if self.pressed_motion_list_item:
+                released_item = self.motion_list.itemAt(event.position().toPoint())
+                if released_item == self.pressed_motion_list_item:
+                    frame_index_data = released_item.data(Qt.UserRole)
+                    if frame_index_data is not None:
+                        try:
+                            frame_index = int(frame_index_data)
+                            if 0 <= frame_index < len(self.all_frame_data):
+                                self.select_frame(frame_index)
+                        except ValueError:
+                            pass
+                self.pressed_motion_list_item = None
+            return True
+        return super().eventFilter(watched_object, event)
+
+    def _handle_frame_preview_viewport_event(self, watched_object, event):
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            if self.pressed_frame_preview_item is not None:
+                released_index = self.frame_preview.indexAt(event.position().toPoint())
+                if released_index.isValid() and released_index.row() == self.pressed_frame_preview_item:
+                    frame_index_data = released_index.data(Qt.UserRole)
+                    if frame_index_data is not None and frame_index_data != -1:
+                        try:
+                            frame_index = int(frame_index_data)
+                            if frame_index >= 0 and frame_index < len(self.all_frame_data):
+                                self.select_frame(frame_index)
+                        except ValueError:
+                            pass
+                self.pressed_frame_preview_item = None
+            return True
+        return super().eventFilter(watched_object, event)
+
     def keyPressEvent(self, event):
         if event.matches(QKeySequence.StandardKey.Copy):
             if QApplication.focusWidget() == self.frame_preview:
-                selected_items = self.frame_preview.selectedItems()
+                selected_items = self.frame_preview.selectionModel().selectedIndexes()
                 if selected_items:
-                    sorted_items = sorted(selected_items, key=lambda item: self.frame_preview.row(item))
-                    clipboard_text = "\n".join([item.text() for item in sorted_items])
+                    # 행 번호는 선택 인덱스당 한 번만 읽어 정렬하고, 텍스트는 모델에서 바로 이어 붙임
+                    sorted_items = sorted(index.row() for index in selected_items)
+                    clipboard_text = "\n".join(map(self.frame_preview_model.row_text, sorted_items))
                     if clipboard_text:
                         QApplication.clipboard().setText(clipboard_text)
                         self._update_status(f"{len(sorted_items)}개 항목(헤더 포함) 설명 선택 복사 완료.", is_complete_success=True)
@@ -1378,18 +1778,15 @@ class GifSplitterUI(QWidget):
 
     def _copy_all_frame_descriptions_to_clipboard(self):
         if not self.all_frame_data and not self.keyframes :
-             if self.frame_preview.count() == 0:
+             if self.frame_preview_model.rowCount() == 0:
                 self._update_status("복사할 프레임 설명 데이터가 없습니다.")
                 return
 
-        all_text = []
-        for i in range(self.frame_preview.count()):
-            item = self.frame_preview.item(i)
-            if item:
-                all_text.append(item.text())
+        row_count = self.frame_preview_model.rowCount()
 
-        if all_text:
-            QApplication.clipboard().setText("\n".join(all_text))
+        if row_count:
+            # 중간 줄 목록 없이 모델의 행 텍스트를 바로 이어 붙임
+            QApplication.clipboard().setText("\n".join(map(self.frame_preview_model.row_text, range(row_count))))
             self._update_status("프레임 설명 전체 내용(헤더 포함) 복사 완료.", is_complete_success=True)
         else:
             self._update_status("복사할 프레임 설명 내용이 없습니다.")
@@ -1422,28 +1819,36 @@ class GifSplitterUI(QWidget):
         """프로젝트 상태와 UI를 초기화합니다. 저장 확인 절차는 포함하지 않습니다."""
         self._stop_playback_and_reset_ui()
         self.gif_path = None
+        self._gif_basename = ""
+        self._gif_base_no_ext = ""
+        self._gif_dirname = ""
         self.project_path = None
         self.keyframes.clear()
+        self._sorted_keyframes_cache = None
+        self._styled_sorted_keys = None
         self.clear_timeline()
         self.frame_buttons.clear()
         self.selected_index = None
         self.unsaved_changes = False
         self.original_gif_info = {}
         self.all_frame_data = []
+        self._last_frame_idx = -1
+        self._frame_rgba_buffer = None
+        self._frame_size = (0, 0)
+        self._frame_label_cache = []
         self.original_gif_palette_data = None
         if self.filename_label: self.filename_label.setText("현재 작업중 : 없음")
         self.selected_frame_label.setText("선택 중인 프레임: -")
         self.motion_name_input.clear()
         self.motion_list.clear()
-        self.frame_preview.clear()
+        self._motion_list_row_keys = ()
+        self.frame_preview_model.set_rows([])
+        QPixmapCache.clear()
 
         if self.pixmap_item:
             self.pixmap_item.setPixmap(QPixmap())
 
-        try:
-            self.current_scale_index = self.scale_levels.index(1.0)
-        except ValueError:
-            self.current_scale_index = 3
+        self.current_scale_index = _SCALE_DEFAULT_INDEX
         self.current_scale_factor = self.scale_levels[self.current_scale_index]
 
         if self.pixmap_item:
@@ -1460,7 +1865,7 @@ class GifSplitterUI(QWidget):
         if hasattr(self, 'loop_btn') and self.loop_btn.isChecked():
             self.loop_btn.setChecked(False)
         elif hasattr(self, 'loop_btn'):
-            self.loop_btn.setIcon(QIcon(self.loop_btn._icon_path_normal_off))
+            self.loop_btn.setIcon(self.loop_btn._icon_normal_off)
             self.loop_btn.setToolTip("현재 모션 반복 (활성화 시)")
 
         self.is_looping_specific_motion = False
@@ -1488,6 +1893,7 @@ class GifSplitterUI(QWidget):
                 project_data = json.load(f)
             loaded_keyframes_str_keys = project_data.get("keyframes", {})
             self.keyframes = {int(k): v for k, v in loaded_keyframes_str_keys.items()}
+            self._sorted_keyframes_cache = None
             self.project_path = proj_path
             self.unsaved_changes = False
 
@@ -1500,16 +1906,19 @@ class GifSplitterUI(QWidget):
             if not silent:
                 QMessageBox.critical(self, "프로젝트 로드 오류", f"프로젝트 파일 형식이 올바르지 않습니다 (JSON 오류).\n파일 내용을 확인해주세요:\n{proj_path}\n{e}")
             self.keyframes = {}
+            self._sorted_keyframes_cache = None
             return False
         except ValueError as e:
             if not silent:
                 QMessageBox.critical(self, "프로젝트 로드 오류", f"프로젝트 파일 내 키프레임 번호가 잘못되었습니다.\n파일 내용을 확인해주세요:\n{proj_path}\n{e}")
             self.keyframes = {}
+            self._sorted_keyframes_cache = None
             return False
         except Exception as e:
             if not silent:
                 QMessageBox.critical(self, "프로젝트 로드 오류", f"프로젝트 파일 로드 중 알 수 없는 오류가 발생했습니다:\n{proj_path}\n{e}\n{traceback.format_exc()}")
             self.keyframes = {}
+            self._sorted_keyframes_cache = None
             return False
 
     def load_gif_file(self):
@@ -1520,29 +1929,50 @@ class GifSplitterUI(QWidget):
         if path:
             self._reset_project_state()
 
-            self._update_status(f"'{os.path.basename(path)}' GIF 불러오는 중...", is_loading=True)
             self.gif_path = path
-            if self.filename_label: self.filename_label.setText(f"현재 작업중 : {os.path.basename(path)}")
+            self._gif_basename = os.path.basename(path)
+            self._gif_base_no_ext = os.path.splitext(self._gif_basename)[0]
+            self._gif_dirname = os.path.dirname(path)
+            self._update_status(f"'{self._gif_basename}' GIF 불러오는 중...", is_loading=True, force=True)
+            self.status_label.repaint() # 이어지는 작업이 UI를 막으므로 상태 표시만 즉시 그림
+            if self.filename_label: self.filename_label.setText(f"현재 작업중 : {self._gif_basename}")
 
             proj_loaded_successfully = False
             try:
-                img = Image.open(path)
-                self.original_gif_info = img.info.copy()
-                self.original_gif_palette_data = img.getpalette() if img.mode == 'P' and img.getpalette() else None
-
-                for i, frame in enumerate(ImageSequence.Iterator(img)):
-                    duration = frame.info.get("duration", 100)
-                    frame_copy = frame.copy(); frame_info = frame.info.copy()
-                    frame_palette = frame.getpalette() if frame.mode == 'P' and frame.getpalette() else None
-                    self.all_frame_data.append({'image': frame_copy, 'delay': duration, 'info': frame_info, 'palette': frame_palette})
-
-                    btn = FrameButton(str(i + 1), i)
-                    btn.setFixedSize(26, 26)
-
-                    btn.clicked.connect(lambda checked=False, idx=i: self.select_frame(idx))
-                    btn.doubleClickedWithIndex.connect(self.handle_frame_button_double_click)
-
-                    self.timeline_layout.addWidget(btn); self.frame_buttons.append(btn)
+                # 로딩 전략 전역값을 출력 작업 스레드가 바꾸지 못하도록 잠금 안에서 기본 전략으로 디코딩
+                with _gif_loading_strategy(GifImagePlugin.LoadingStrategy.RGB_AFTER_FIRST):
+                    img = Image.open(path)
+                    self.original_gif_info = img.info.copy()
+                    self.original_gif_palette_data = (img.getpalette() or None) if img.mode == 'P' else None
+                    self._frame_size = img.size
+                    frame_count = _fast_count_frames(path)
+                    self._update_status(f"'{self._gif_basename}' GIF 불러오는 중... ({frame_count}프레임)", is_loading=True, force=True)
+                    self.status_label.repaint()
+                    # 프레임 수를 미리 알고 있으므로 RGBA 버퍼를 한 번에 할당
+                    frame_bytes = img.size[0] * img.size[1] * 4
+                    rgba_buffer = bytearray(frame_count * frame_bytes)
+
+                    # 프레임 버튼을 모두 추가할 때까지 타임라인 다시 그리기를 멈춤 (버튼마다 갱신 방지)
+                    self.timeline_widget.setUpdatesEnabled(False)
+                    try:
+                        for i, frame in enumerate(ImageSequence.Iterator(img)):
+                            duration = frame.info.get("duration", 100)
+                            # 프레임 이미지는 보관하지 않음 (미리보기는 RGBA 버퍼, 출력은 원본 파일에서 다시 읽음), 팔레트는 프레임당 한 번만 추출
+                            frame_info = frame.info.copy()
+                            frame_palette = (frame.getpalette() or None) if frame.mode == 'P' else None
+                            self.all_frame_data.append({'delay': duration, 'info': frame_info, 'palette': frame_palette})
+                            rgba_buffer[i * frame_bytes:(i + 1) * frame_bytes] = _frame_to_rgba(frame, frame_info).tobytes("raw", "RGBA")
+
+                            btn = self._acquire_frame_button(i)
+                            self.timeline_layout.addWidget(btn); self.frame_buttons.append(btn)
+                    finally:
+                        self._release_unused_frame_buttons()
+                        self.timeline_widget.setUpdatesEnabled(True)
+
+                del rgba_buffer[len(self.all_frame_data) * frame_bytes:] # 헤더 기준 수와 실제 디코딩 수가 다를 때 대비
+                self._frame_rgba_buffer = rgba_buffer
+                self._last_frame_idx = len(self.all_frame_data) - 1
+                self._frame_label_cache = [_format_frame_label(i) for i in range(len(self.all_frame_data))]
 
                 base_name = os.path.splitext(self.gif_path)[0]
                 proj_path = base_name + ".gifproj"
@@ -1550,6 +1980,7 @@ class GifSplitterUI(QWidget):
                     proj_loaded_successfully = True
 
                 if self.all_frame_data:
+                    self.refresh_motion_list()
                     self.select_frame(0, _internal_call_maintains_play_state=True)
                     if self.graphics_view and self.pixmap_item and not self.pixmap_item.pixmap().isNull():
                         # 버그 수정: Scene의 영역을 이미지 크기에 맞게 재설정
@@ -1558,7 +1989,7 @@ class GifSplitterUI(QWidget):
 
                         current_transform = self.graphics_view.transform()
                         self.current_scale_factor = current_transform.m11()
-                        self.current_scale_index = min(range(len(self.scale_levels)), key=lambda i: abs(self.scale_levels[i] - self.current_scale_factor))
+                        self.current_scale_index = _nearest_scale_index(self.current_scale_factor)
                 else:
                     self.refresh_motion_list()
                     self.update_frame_button_styles()
@@ -1566,7 +1997,7 @@ class GifSplitterUI(QWidget):
                 self._update_primary_keyframe_button_ui()
                 self._update_preview_button_states()
 
-                msg = f"'{os.path.basename(self.gif_path)}' GIF 불러오기 완료."
+                msg = f"'{self._gif_basename}' GIF 불러오기 완료."
                 if proj_loaded_successfully:
                     msg += " .gifproj 파일확인, 불러오기 완료."
                 self._update_status(msg, is_complete_success=True)
@@ -1580,13 +2011,16 @@ class GifSplitterUI(QWidget):
             self._update_preview_button_states()
 
     def _actual_save_settings(self, save_path):
-        self._update_status(f"'{os.path.basename(save_path)}' 설정 파일 저장 중...", is_loading=True)
-        serializable_keyframes = {str(k): v for k, v in self.keyframes.items()}
-        project_data = {"gif_path": os.path.basename(self.gif_path) if self.gif_path else "",
-                        "keyframes": serializable_keyframes}
+        self._update_status(f"'{os.path.basename(save_path)}' 설정 파일 저장 중...", is_loading=True, force=True)
+        self.status_label.repaint()
+        # json 모듈이 int 키를 문자열 키로 직접 기록하므로 키 변환용 dict를 따로 만들지 않음
+        project_data = {"gif_path": self._gif_basename,
+                        "keyframes": self.keyframes}
         try:
+            # indent 지정 시 json.dump는 조각마다 write를 호출하므로 문자열로 만든 뒤 한 번에 기록
+            project_text = json.dumps(project_data, indent=2, ensure_ascii=False)
             with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(project_data, f, indent=2, ensure_ascii=False)
+                f.write(project_text)
             self.unsaved_changes = False
             self.project_path = save_path # 저장 성공 시 경로 업데이트
             self._update_status(f"'{os.path.basename(save_path)}' 파일 저장완료.", is_complete_success=True)
@@ -1619,8 +2053,8 @@ class GifSplitterUI(QWidget):
             QMessageBox.warning(self, "저장 오류", "먼저 GIF 파일을 불러와주세요.")
             return False
 
-        default_filename = os.path.splitext(os.path.basename(self.gif_path))[0] + ".gifproj"
-        suggested_path = os.path.join(os.path.dirname(self.gif_path) if self.gif_path else "", default_filename)
+        default_filename = self._gif_base_no_ext + ".gifproj"
+        suggested_path = os.path.join(self._gif_dirname, default_filename)
 
         new_path, _ = QFileDialog.getSaveFileName(self, "다른 이름으로 설정 저장", suggested_path, "GIF 프로젝트 파일 (*.gifproj)")
 
@@ -1639,7 +2073,8 @@ class GifSplitterUI(QWidget):
             self._update_status("설정 불러오기 취소됨.")
             return
 
-        self._update_status(f"'{os.path.basename(path)}' 설정 파일 불러오는 중...", is_loading=True)
+        self._update_status(f"'{os.path.basename(path)}' 설정 파일 불러오는 중...", is_loading=True, force=True)
+        self.status_label.repaint()
         proj_gif_name_in_file = None
         try:
             with open(path, 'r', encoding='utf-8') as f: temp_project_data = json.load(f)
@@ -1650,7 +2085,7 @@ class GifSplitterUI(QWidget):
             return
 
         if self.gif_path:
-            current_gif_name = os.path.basename(self.gif_path)
+            current_gif_name = self._gif_basename
             if proj_gif_name_in_file and current_gif_name != proj_gif_name_in_file:
                 reply = QMessageBox.question(self, "경고: GIF 불일치", f"현재 GIF '{current_gif_name}'과 프로젝트의 GIF '{proj_gif_name_in_file}'이 다릅니다.\n계속 로드하시겠습니까?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
                 if reply == QMessageBox.StandardButton.No:
@@ -1675,17 +2110,18 @@ class GifSplitterUI(QWidget):
         if not self.gif_path or not self.all_frame_data: QMessageBox.warning(self, "출력 오류", "먼저 GIF 파일을 불러와주세요."); self._update_status("애니샘플 출력 오류: GIF 없음."); return
         if not self.keyframes: QMessageBox.warning(self, "출력 오류", "모션(키프레임)이 등록되지 않았습니다."); self._update_status("애니샘플 출력 오류: 키프레임 없음."); return
 
-        output_dir_dialog = QFileDialog(self, "모션 GIF 저장 폴더 선택", os.path.dirname(self.gif_path) if self.gif_path else "")
+        output_dir_dialog = QFileDialog(self, "모션 GIF 저장 폴더 선택", self._gif_dirname)
         output_dir_dialog.setFileMode(QFileDialog.FileMode.Directory); output_dir_dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
         if not output_dir_dialog.exec():
             self._update_status("애니샘플 출력 취소됨.")
             return
         output_dir = output_dir_dialog.selectedFiles()[0]
 
-        self._update_status("애니샘플 출력 중...", is_loading=True)
+        self._update_status("애니샘플 출력 중...", is_loading=True, force=True)
+        self.status_label.repaint()
         exported_count, first_exported_basename = self._perform_gif_export(output_dir)
 
-        base_name = os.path.basename(self.gif_path) if self.gif_path else "알 수 없는 파일"
+        base_name = self._gif_basename if self.gif_path else "알 수 없는 파일"
         original_file_base_name_no_ext = os.path.splitext(base_name)[0]
 
         if exported_count > 0:
@@ -1695,159 +2131,183 @@ class GifSplitterUI(QWidget):
             else:
                 msg = f"'{original_file_base_name_no_ext}'의 애니샘플 {exported_count}종 저장 완료. {first_exported_basename} 외 {others_count}종"
             self._update_status(msg, is_complete_success=True)
-        elif hasattr(self, '_called_from_export_all') and self._called_from_export_all and exported_count == 0:
+        elif self._called_from_export_all and exported_count == 0:
             pass
-        elif exported_count == 0 and not (hasattr(self, '_called_from_export_all') and self._called_from_export_all):
+        elif exported_count == 0 and not self._called_from_export_all:
              self._update_status(f"'{original_file_base_name_no_ext}'의 애니샘플 출력 실패 또는 생성된 파일 없음.")
 
-    def _perform_gif_export(self, output_dir):
-        if not self.gif_path or not self.all_frame_data or not self.keyframes:
+    def _keyframes_snapshot(self):
+        # 출력 중 (작업 스레드 대기 동안) 키프레임이 편집돼도 GIF와 TXT가 같은 모션 구성을 쓰도록 복사해 둠
+        return dict(self.keyframes), list(self._get_sorted_keys())
+
+    def _perform_gif_export(self, output_dir, keyframes_snapshot=None):
+        keyframes, sorted_keys = keyframes_snapshot or self._keyframes_snapshot()
+        if not self.gif_path or not self.all_frame_data or not keyframes:
             print("GIF export prerequisites not met in _perform_gif_export.")
-            if hasattr(self, '_called_from_export_all') and self._called_from_export_all:
-                 if hasattr(self, '_export_all_errors'): self._export_all_errors.append("GIFs: 전제조건 미충족")
+            if self._called_from_export_all:
+                self._export_all_errors.append("GIFs: 전제조건 미충족")
             else:
                 self._update_status("GIF 출력 오류: 전제조건 미충족")
             return 0, None
 
-        exported_count = 0
-        exported_basenames = []
-        first_exported_name = None
         try:
-            sorted_keys = sorted(self.keyframes.keys())
             loop_count = self.original_gif_info.get('loop', 0)
             original_global_background_idx = self.original_gif_info.get('background', None)
-            original_file_base_name_no_ext = os.path.splitext(os.path.basename(self.gif_path))[0]
+            original_file_base_name_no_ext = self._gif_base_no_ext
+            total_frames = len(self.all_frame_data)
 
+            # 작업 스레드에 넘길 구간 목록은 UI 스레드에서 미리 만들어 둠
+            segments = []
             for i, start_frame_idx in enumerate(sorted_keys):
-                end_frame_idx = sorted_keys[i+1] - 1 if i+1 < len(sorted_keys) else len(self.all_frame_data) - 1
-                motion_name = self.keyframes[start_frame_idx]
-                safe_motion_name = "".join(c if c.isalnum() or c in (' ', '_', '-') else '_' for c in motion_name).rstrip()
+                end_frame_idx = sorted_keys[i+1] - 1 if i+1 < len(sorted_keys) else total_frames - 1
+                motion_name = keyframes[start_frame_idx]
+                safe_motion_name = _UNSAFE_NAME_CHAR_RE.sub('_', motion_name).rstrip()
                 output_filename = f"{original_file_base_name_no_ext}_{start_frame_idx+1:02d}-{end_frame_idx+1:02d}_{safe_motion_name}.gif"
                 output_path = os.path.join(output_dir, output_filename)
-
-                segment_frames_for_save = []; segment_delays_for_save = []
-                for frame_idx_in_loop in range(start_frame_idx, end_frame_idx + 1):
-                    if not (0 <= frame_idx_in_loop < len(self.all_frame_data)): continue
-                    original_frame_dict = self.all_frame_data[frame_idx_in_loop]
-                    frame_to_save = original_frame_dict['image'].copy()
-                    frame_to_save.info = original_frame_dict['info'].copy()
-                    segment_frames_for_save.append(frame_to_save)
-                    segment_delays_for_save.append(original_frame_dict['delay'])
-
-                if not segment_frames_for_save: continue
-
-                first_frame_to_save = segment_frames_for_save[0]
-                save_options = {
-                    'save_all': True, 'append_images': segment_frames_for_save[1:],
-                    'duration': segment_delays_for_save, 'loop': loop_count, 'optimize': False,
-                }
-                if original_global_background_idx is not None: save_options['background'] = original_global_background_idx
-                first_frame_to_save.save(output_path, **save_options)
-                exported_count += 1
-                exported_basenames.append(os.path.basename(output_path))
-
+                segment_frames = [(frame_idx, self.all_frame_data[frame_idx]['info'], self.all_frame_data[frame_idx]['delay'])
+                                  for frame_idx in range(max(start_frame_idx, 0), min(end_frame_idx, total_frames - 1) + 1)]
+                if segment_frames: segments.append((output_path, segment_frames))
+
+            exported_basenames = self._run_gif_export_worker(self.gif_path, segments, loop_count, original_global_background_idx)
+            if exported_basenames is None:
+                self._update_status("애니샘플 출력이 취소되었습니다.")
+                return 0, None
+            exported_count = len(exported_basenames)
             first_exported_name = exported_basenames[0] if exported_basenames else None
-            if exported_count > 0 and not hasattr(self, '_called_from_export_all'):
+            if exported_count > 0 and not self._called_from_export_all:
                 QMessageBox.information(self, "모션 GIF 출력 완료", f"{exported_count}개의 모션 GIF 파일이 성공적으로 저장되었습니다.")
-            elif exported_count == 0 and not hasattr(self, '_called_from_export_all'):
+            elif exported_count == 0 and not self._called_from_export_all:
                  QMessageBox.warning(self, "모션 GIF 출력 실패", "생성된 모션 GIF 파일이 없습니다.")
             return exported_count, first_exported_name
         except Exception as e:
             error_msg = f"GIFs: {str(e)}"
-            if not hasattr(self, '_called_from_export_all'):
-                QMessageBox.critical(self, "GIF 출력 오류", f"모션 GIF 출력 중 오류 발생:\n{e}\n{traceback.format_exc()}")
+            # 작업 스레드에서 난 예외는 UI 스레드 traceback 대신 실제 실패 위치(Pillow 등)를 보여줌
+            error_tb = e.worker_traceback if isinstance(e, GifExportError) else traceback.format_exc()
+            if not self._called_from_export_all:
+                QMessageBox.critical(self, "GIF 출력 오류", f"모션 GIF 출력 중 오류 발생:\n{e}\n{error_tb}")
                 self._update_status("애니샘플 GIF 출력 중 오류 발생.")
             else:
-                if hasattr(self, '_export_all_errors'): self._export_all_errors.append(error_msg)
-            print(f"Unexpected error during GIF export: {e}\n{traceback.format_exc()}")
+                self._export_all_errors.append(error_msg)
+            print(f"Unexpected error during GIF export: {e}\n{error_tb}")
             return 0, None
 
+    def _run_gif_export_worker(self, gif_path, segments, loop_count, background_idx):
+        # 인코딩은 스레드 풀에서, 완료까지 로컬 이벤트 루프로 대기 (창은 계속 다시 그려짐)
+        worker = GifExportWorker(gif_path, segments, loop_count, background_idx)
+        result = {}
+        wait_loop = QEventLoop()
+        worker.signals.finished.connect(lambda names: (result.update(names=names), wait_loop.quit()))
+        worker.signals.failed.connect(lambda msg, tb: (result.update(error=(msg, tb)), wait_loop.quit()))
+
+        # 인코딩 중에는 GIF 로딩 전략 잠금을 작업 스레드가 쥐고 있으므로, 다른 GIF를 여는 버튼도 잠가 UI가 잠금을 기다리며 멈추지 않게 함
+        locked_buttons = (self.export_gif_btn, self.export_txt_btn, self.export_all_btn,
+                          self.new_project_btn, self.load_btn, self.load_cfg_btn)
+        for btn in locked_buttons: btn.setEnabled(False)
+        self._exporting = True
+        try:
+            QThreadPool.globalInstance().start(worker)
+            wait_loop.exec()
+        finally:
+            self._exporting = False
+            for btn in locked_buttons: btn.setEnabled(True)
+
+        if 'error' in result:
+            msg, tb = result['error']
+            raise GifExportError(msg, tb)
+        # 앱 종료 등으로 대기 루프가 결과 없이 끝난 경우는 취소로 처리
+        return result.get('names')
+
     def export_frame_descriptions_to_txt(self):
         if not self.gif_path or not self.all_frame_data: QMessageBox.warning(self, "출력 오류", "먼저 GIF 파일을 불러와주세요."); self._update_status("프레임 설명 출력 오류: GIF 없음."); return
 
-        original_file_base_name_no_ext = os.path.splitext(os.path.basename(self.gif_path))[0]
+        original_file_base_name_no_ext = self._gif_base_no_ext
         default_txt_filename = f"{original_file_base_name_no_ext}_프레임설명.txt"
-        suggested_dir = os.path.dirname(self.gif_path) if self.gif_path else ""
+        suggested_dir = self._gif_dirname
         output_path, _ = QFileDialog.getSaveFileName(self, "프레임 설명 저장", os.path.join(suggested_dir, default_txt_filename), "Text Files (*.txt)")
         if not output_path:
             self._update_status("프레임 설명 출력 취소됨.")
             return
 
-        self._update_status("프레임 설명 TXT 파일 저장 중...", is_loading=True)
+        self._update_status("프레임 설명 TXT 파일 저장 중...", is_loading=True, force=True)
+        self.status_label.repaint()
         if self._perform_txt_export(output_path):
             txt_filename = os.path.basename(output_path)
             self._update_status(f"'{original_file_base_name_no_ext}'의 프레임설명 저장 완료: {txt_filename}", is_complete_success=True)
 
-    def _perform_txt_export(self, output_path):
+    def _perform_txt_export(self, output_path, keyframes_snapshot=None):
+        keyframes, sorted_keys = keyframes_snapshot or (self.keyframes, self._get_sorted_keys())
         if not self.gif_path or not self.all_frame_data:
             print("TXT export prerequisites not met in _perform_txt_export.")
-            if hasattr(self, '_called_from_export_all') and self._called_from_export_all:
-                if hasattr(self, '_export_all_errors'): self._export_all_errors.append("TXT: 전제조건 미충족")
+            if self._called_from_export_all:
+                self._export_all_errors.append("TXT: 전제조건 미충족")
             else:
                 self._update_status("TXT 출력 오류: 전제조건 미충족")
             return False
 
         try:
-            content = []
-            if not self.keyframes:
-                content.append("--- 전체 프레임 데이터 (키프레임 없음) ---")
-                if not self.all_frame_data: content.append("(로드된 프레임 데이터가 없습니다)")
-                for idx, frame_data in enumerate(self.all_frame_data):
-                    delay = frame_data['delay']
-                    content.append(f"{self._format_frame_number(idx)} : {delay}ms")
-            else:
-                sorted_keys = sorted(self.keyframes.keys())
-                for i, start_frame_idx in enumerate(sorted_keys):
-                    end_frame_idx = sorted_keys[i+1] - 1 if i+1 < len(sorted_keys) else len(self.all_frame_data)-1
-                    motion_name = self.keyframes[start_frame_idx]
-                    content.append(f"--- {motion_name} ({self._format_frame_number(start_frame_idx)} ~ {self._format_frame_number(end_frame_idx)}) ---")
-                    for frame_idx_in_segment in range(start_frame_idx, end_frame_idx + 1):
-                        if 0 <= frame_idx_in_segment < len(self.all_frame_data):
-                            delay = self.all_frame_data[frame_idx_in_segment]['delay']
-                            content.append(f"{self._format_frame_number(frame_idx_in_segment)} : {delay}ms")
-                    content.append("")
-            with open(output_path, 'w', encoding='utf-8') as f: f.write("\n".join(content))
-
-            if not hasattr(self, '_called_from_export_all'):
+            # 줄 목록을 모아 join 하지 않고 파일에 바로 씀 (출력 형식은 이전과 동일)
+            format_number = self._format_frame_number
+            all_frame_data = self.all_frame_data
+            frame_count = len(all_frame_data)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                write = f.write
+                if not keyframes:
+                    write("--- 전체 프레임 데이터 (키프레임 없음) ---")
+                    if not all_frame_data: write("\n(로드된 프레임 데이터가 없습니다)")
+                    for idx, frame_data in enumerate(all_frame_data):
+                        write(f"\n{format_number(idx)} : {frame_data['delay']}ms")
+                else:
+                    for i, start_frame_idx in enumerate(sorted_keys):
+                        end_frame_idx = sorted_keys[i+1] - 1 if i+1 < len(sorted_keys) else frame_count-1
+                        motion_name = keyframes[start_frame_idx]
+                        if i > 0: write("\n")
+                        write(f"--- {motion_name} ({format_number(start_frame_idx)} ~ {format_number(end_frame_idx)}) ---\n")
+                        for frame_idx_in_segment in range(max(start_frame_idx, 0), min(end_frame_idx, frame_count - 1) + 1):
+                            write(f"{format_number(frame_idx_in_segment)} : {all_frame_data[frame_idx_in_segment]['delay']}ms\n")
+
+            if not self._called_from_export_all:
                 QMessageBox.information(self, "프레임 설명 출력 완료", f"프레임 설명이 성공적으로 저장되었습니다:\n{output_path}")
             return True
         except Exception as e:
             error_msg = f"TXT: {str(e)}"
-            if not hasattr(self, '_called_from_export_all'):
+            if not self._called_from_export_all:
                 QMessageBox.critical(self, "TXT 출력 오류", f"프레임 설명 파일 저장 중 오류 발생:\n{e}\n{traceback.format_exc()}")
                 self._update_status("프레임 설명 TXT 파일 저장 중 오류 발생.")
             else:
-                if hasattr(self, '_export_all_errors'): self._export_all_errors.append(error_msg)
+                self._export_all_errors.append(error_msg)
             print(f"Error during TXT export: {e}\n{traceback.format_exc()}")
             return False
 
     def export_all_data(self):
         if not self.gif_path or not self.all_frame_data: QMessageBox.warning(self, "출력 오류", "먼저 GIF 파일을 불러와주세요."); self._update_status("일괄 저장 오류: GIF 없음."); return
 
-        output_dir_dialog = QFileDialog(self, "모든 데이터 저장 폴더 선택", os.path.dirname(self.gif_path) if self.gif_path else "")
+        output_dir_dialog = QFileDialog(self, "모든 데이터 저장 폴더 선택", self._gif_dirname)
         output_dir_dialog.setFileMode(QFileDialog.FileMode.Directory); output_dir_dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
         if not output_dir_dialog.exec():
             self._update_status("일괄 저장 취소됨.")
             return
         output_dir = output_dir_dialog.selectedFiles()[0]
 
-        self._update_status("모든 데이터 일괄 저장 중...", is_loading=True)
+        self._update_status("모든 데이터 일괄 저장 중...", is_loading=True, force=True)
+        self.status_label.repaint()
         self._called_from_export_all = True
-        self._export_all_errors = []
+        self._export_all_errors.clear()
 
+        # GIF와 TXT 모두 같은 키프레임 복사본으로 출력
+        keyframes_snapshot = self._keyframes_snapshot()
         gif_exported_count = 0
         first_exported_gif_basename = None
-        if self.keyframes:
-            gif_exported_count, first_exported_gif_basename = self._perform_gif_export(output_dir)
+        if keyframes_snapshot[0]:
+            gif_exported_count, first_exported_gif_basename = self._perform_gif_export(output_dir, keyframes_snapshot)
         elif self.all_frame_data:
              QMessageBox.information(self, "GIF 출력 알림", "키프레임이 없어 GIF 파일은 출력되지 않습니다. 프레임 설명만 출력됩니다.")
 
-        original_file_base_name_no_ext = os.path.splitext(os.path.basename(self.gif_path))[0]
+        original_file_base_name_no_ext = self._gif_base_no_ext
         default_txt_filename = f"{original_file_base_name_no_ext}_프레임설명.txt"
         output_txt_path = os.path.join(output_dir, default_txt_filename)
-        txt_exported_success = self._perform_txt_export(output_txt_path)
+        txt_exported_success = self._perform_txt_export(output_txt_path, keyframes_snapshot)
 
-        del self._called_from_export_all
+        self._called_from_export_all = False
 
         status_msg_parts = []
         if gif_exported_count > 0:
@@ -1876,30 +2336,37 @@ class GifSplitterUI(QWidget):
         self._update_status(final_status_msg, is_complete_success=(not self._export_all_errors and (gif_exported_count > 0 or txt_exported_success)))
 
         if not self._export_all_errors and (gif_exported_count > 0 or txt_exported_success):
-            QMessageBox.information(self, "모두 저장 완료", "선택한 폴더에 파일들이 저장되었습니다.\n" + final_status_msg.replace(". ", ".\n"))
+            QMessageBox.information(self, "모두 저장 완료", f"선택한 폴더에 파일들이 저장되었습니다.\n{final_status_msg}")
         elif not self._export_all_errors and not gif_exported_count and not txt_exported_success:
              QMessageBox.warning(self, "출력 결과", "키프레임이 없거나 데이터가 없어 저장된 파일이 없습니다.")
 
-        if hasattr(self, '_export_all_errors'):
-            del self._export_all_errors
+        self._export_all_errors.clear()
+
+    def _get_frame_pixmap(self, index):
+        # 프레임별 픽스맵은 QPixmapCache(용량 제한 LRU)에 보관, 캐시 미스일 때만 RGBA 버퍼에서 변환
+        cache_key = f"frame:{self.gif_path}:{index}"
+        frame_pixmap = QPixmapCache.find(cache_key)
+        if frame_pixmap is None:
+            frame_pixmap = self._render_frame_pixmap(index)
+            QPixmapCache.insert(cache_key, frame_pixmap)
+        return frame_pixmap
+
+    def _render_frame_pixmap(self, index):
+        # 로드 시 미리 변환해 둔 RGBA 버퍼 구간을 복사 없이 QImage로 감쌈 (PIL 재진입 없음)
+        width, height = self._frame_size
+        frame_bytes = width * height * 4
+        frame_view = memoryview(self._frame_rgba_buffer)[index * frame_bytes:(index + 1) * frame_bytes]
+        qimg = QImage(frame_view, width, height, width * 4, QImage.Format.Format_RGBA8888)
+        return QPixmap.fromImage(qimg)
 
     def select_frame(self, index, _internal_call_maintains_play_state=False):
-        if not (0 <= index < len(self.all_frame_data)):
+        if not (0 <= index <= self._last_frame_idx):
             return
 
         if self.playback_timer.isActive() and not _internal_call_maintains_play_state:
             self._stop_playback_and_reset_ui()
 
-        pil_frame_to_display = self.all_frame_data[index]['image']
-
-        if pil_frame_to_display.mode == 'P':
-            pil_frame_to_display = pil_frame_to_display.convert("RGBA") if 'transparency' in self.all_frame_data[index]['info'] else pil_frame_to_display.convert("RGB").convert("RGBA")
-        else:
-            pil_frame_to_display = pil_frame_to_display.convert("RGBA")
-
-        data = pil_frame_to_display.tobytes("raw", "RGBA")
-        qimg = QImage(data, pil_frame_to_display.width, pil_frame_to_display.height, QImage.Format.Format_RGBA8888)
-        frame_pixmap = QPixmap.fromImage(qimg)
+        frame_pixmap = self._get_frame_pixmap(index)
 
         if self.pixmap_item:
             self.pixmap_item.setPixmap(frame_pixmap)
@@ -1911,11 +2378,14 @@ class GifSplitterUI(QWidget):
                 else:
                     self._update_preview_button_states()
 
+        previous_selected_index = self.selected_index
         self.selected_index = index
         self.selected_frame_label.setText(f"선택 중인 프레임: {index + 1} ({self.all_frame_data[index]['delay']}ms)")
-        self.update_frame_button_styles()
+        self.update_frame_button_styles((previous_selected_index, index))
         self._update_primary_keyframe_button_ui()
-        self.refresh_motion_list()
+        # 선택만 바뀐 경우이므로 목록은 다시 만들지 않고 강조 표시만 갱신
+        self.frame_preview_model.update_selected_frame(previous_selected_index, index)
+        self._sync_motion_list_selection()
 
         if not self.playback_timer.isActive():
             self.current_playback_frame_index = index
@@ -1923,41 +2393,36 @@ class GifSplitterUI(QWidget):
         if self.selected_index is not None:
             self.ensure_frame_visible(self.selected_index)
 
-    def update_frame_button_styles(self):
-        sorted_keys = sorted(self.keyframes.keys())
-        for i, btn in enumerate(self.frame_buttons):
-            is_keyframe = i in self.keyframes
-            is_selected = (i == self.selected_index)
-
-            current_style_dict = {"padding": "0px", "margin": "0px"}
+    def update_frame_button_styles(self, changed_indices=None):
+        sorted_keys = self._get_sorted_keys()
+        _, motion_ends = self._get_motion_map()
+        frame_buttons = self.frame_buttons
+        keyframes = self.keyframes
+        selected_index = self.selected_index
+        # 키프레임 구성이 마지막 전체 갱신 이후 그대로면 지정된 버튼(이전/새 선택)만 다시 계산
+        if changed_indices is None or self._styled_sorted_keys is not sorted_keys:
+            changed_indices = range(len(frame_buttons))
+            self._styled_sorted_keys = sorted_keys
+        for i in changed_indices:
+            if i is None or not (0 <= i < len(frame_buttons)):
+                continue
+            btn = frame_buttons[i]
+            is_keyframe = i in keyframes
+            is_selected = (i == selected_index)
 
             if is_selected:
-                current_style_dict["background-color"] = "#FFFFFF"
-                current_style_dict["color"] = "black"
-                current_style_dict["border"] = "2px solid #ffffff"
-                if is_keyframe:
-                    current_style_dict["border"] = "2px solid orange"
+                frame_state = "selected_keyframe" if is_keyframe else "selected"
             elif is_keyframe:
-                current_style_dict["background-color"] = "#202020"
-                current_style_dict["color"] = "white"
-                current_style_dict["border"] = "2px solid orange"
+                frame_state = "keyframe"
             else:
-                in_motion_segment = False
-                for k_idx, start_frame in enumerate(sorted_keys):
-                    if start_frame <= i:
-                        if k_idx + 1 < len(sorted_keys): end_frame = sorted_keys[k_idx + 1] - 1
-                        else: end_frame = len(self.all_frame_data) - 1
-                        if i <= end_frame: in_motion_segment = True; break
-
-                current_style_dict["color"] = "white"
-                current_style_dict["border"] = "1px solid rgba(0, 0, 0, 0.5)"
-                if in_motion_segment:
-                    current_style_dict["background-color"] = "#353535"
-                else:
-                    current_style_dict["background-color"] = "#404040"
+                in_motion_segment = i < len(motion_ends) and motion_ends[i] != -1
+                frame_state = "segment" if in_motion_segment else "normal"
 
-            normal_style_str = self._generate_style_str_from_dict(current_style_dict)
-            btn.setStyleSheet(normal_style_str)
+            # 상태가 바뀐 버튼만 스타일 재적용 (timeline_widget의 공용 스타일시트 규칙 사용)
+            if btn.property("frameState") != frame_state:
+                btn.setProperty("frameState", frame_state)
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
 
     def add_keyframe(self):
         name = self.motion_name_input.text().strip()
@@ -1965,6 +2430,7 @@ class GifSplitterUI(QWidget):
         if self.selected_index is None: QMessageBox.warning(self, "프레임 선택 오류", "먼저 프레임을 선택해주세요."); return
 
         self.keyframes[self.selected_index] = name
+        self._sorted_keyframes_cache = None
         self.motion_name_input.clear();
         self.update_frame_button_styles()
         self.refresh_motion_list(); self.unsaved_changes = True
@@ -1972,9 +2438,10 @@ class GifSplitterUI(QWidget):
         self._update_status(f"프레임 {self.selected_index + 1}에 '{name}' 모션 등록 완료.", is_complete_success=True)
 
     def remove_keyframe(self):
-        if self.selected_index is not None and self.selected_index in self.keyframes:
-            removed_motion_name = self.keyframes[self.selected_index]
-            del self.keyframes[self.selected_index]
+        if self.selected_index is None: return
+        removed_motion_name = self.keyframes.pop(self.selected_index, None)
+        if removed_motion_name is not None:
+            self._sorted_keyframes_cache = None
             self.update_frame_button_styles()
             self.refresh_motion_list(); self.unsaved_changes = True
             self._update_primary_keyframe_button_ui()
@@ -1993,22 +2460,17 @@ class GifSplitterUI(QWidget):
             print(f"오류: 모션 아이템의 UserRole 데이터가 유효한 정수가 아닙니다: {start_frame_internal_data}")
             return
 
-        if start_frame_internal not in self.keyframes:
+        current_name = self.keyframes.get(start_frame_internal)
+        if current_name is None:
+            # 아이템 데이터가 어긋난 경우 목록을 만들 때 기록한 행 -> 키 매핑으로 찾음
             selected_row = self.motion_list.row(item)
-            if selected_row < 0: return
-            sorted_keys = sorted(self.keyframes.keys())
-            if selected_row >= len(sorted_keys): return
-            start_frame_internal = sorted_keys[selected_row]
-            if start_frame_internal not in self.keyframes:
+            if not (0 <= selected_row < len(self._motion_list_row_keys)): return
+            start_frame_internal = self._motion_list_row_keys[selected_row]
+            current_name = self.keyframes.get(start_frame_internal)
+            if current_name is None:
                 QMessageBox.warning(self, "데이터 오류", "선택된 모션의 내부 데이터를 찾을 수 없습니다.")
                 return
 
-        current_name = self.keyframes.get(start_frame_internal)
-
-        if current_name is None:
-            print(f"오류: 프레임 인덱스 {start_frame_internal}에 해당하는 모션 이름이 None입니다.")
-            return
-
         new_name, ok = QInputDialog.getText(self, "모션 이름 수정", "새 모션 이름을 입력하세요:", QLineEdit.EchoMode.Normal, current_name)
         if ok and new_name.strip() and new_name.strip() != current_name:
             self.keyframes[start_frame_internal] = new_name.strip()
@@ -2020,132 +2482,133 @@ class GifSplitterUI(QWidget):
     def _sync_motion_list_selection(self):
         for i in range(self.motion_list.count()):
             item = self.motion_list.item(i)
-            if item:
-                widget = self.motion_list.itemWidget(item)
-                if isinstance(widget, QLabel):
-                    font = widget.font()
-                    font.setBold(False)
-                    widget.setFont(font)
+            if item and item.font().bold():
+                item.setFont(self.motion_list.font())
 
         if not self.keyframes or self.selected_index is None or self.motion_list.count() == 0:
             self.motion_list.setCurrentRow(-1)
             return
 
-        sorted_key_indices = sorted(self.keyframes.keys())
-        target_item_index_in_list = -1
-
-        for motion_idx, key_start_frame in enumerate(sorted_key_indices):
-            key_end_frame = sorted_key_indices[motion_idx + 1] - 1 if motion_idx + 1 < len(sorted_key_indices) else len(self.all_frame_data) - 1
-            if key_start_frame <= self.selected_index <= key_end_frame:
-                target_item_index_in_list = motion_idx
-                break
+        # 선택 프레임 이하의 마지막 키가 소속 모션 (다음 키 직전까지이므로 마지막 모션만 끝 프레임 확인)
+        sorted_key_indices = self._get_sorted_keys()
+        target_item_index_in_list = bisect.bisect_right(sorted_key_indices, self.selected_index) - 1
+        if target_item_index_in_list == len(sorted_key_indices) - 1 and self.selected_index > len(self.all_frame_data) - 1:
+            target_item_index_in_list = -1
 
         if target_item_index_in_list != -1:
             self.motion_list.setCurrentRow(target_item_index_in_list)
             current_item = self.motion_list.item(target_item_index_in_list)
             if current_item:
-                widget = self.motion_list.itemWidget(current_item)
-                if isinstance(widget, QLabel):
-                    font = widget.font()
-                    font.setBold(True)
-                    widget.setFont(font)
+                font = self.motion_list.font()
+                font.setBold(True)
+                current_item.setFont(font)
         else:
             self.motion_list.setCurrentRow(-1)
 
     def refresh_motion_list(self):
         self.motion_list.clear()
-        self.frame_preview.clear()
-        if not self.all_frame_data: return
+        self._motion_list_row_keys = ()
+        if not self.all_frame_data:
+            self.frame_preview_model.set_rows([])
+            return
 
-        keyframe_color_code = "#FFA500"
-        default_text_color_code = "#FFFFFF"
         item_vertical_padding = 2
         preview_item_height_reduction_factor = 0.75
 
+        # 미리보기 행은 헤더 문자열/프레임 인덱스만 모아 모델에 넘기고, 텍스트는 모델이 표시 시점에 생성
+        font_metrics_preview = QFontMetrics(self.frame_preview.font())
+        preview_header_height = int((font_metrics_preview.height() + item_vertical_padding) * preview_item_height_reduction_factor)
+        if preview_header_height < font_metrics_preview.height(): preview_header_height = font_metrics_preview.height()
+        preview_header_width = self.frame_preview.width() - 20
+        frame_count = len(self.all_frame_data)
+
         if not self.keyframes:
-            header_item = QListWidgetItem(f"--- 전체 프레임 ({len(self.all_frame_data)}개) ---")
-            header_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter); header_item.setForeground(QColor("#FFA07A"))
-            header_item.setData(Qt.UserRole, -1)
-            self.frame_preview.addItem(header_item)
-
-            font_metrics = QFontMetrics(self.frame_preview.font())
-            header_height = int((font_metrics.height() + item_vertical_padding) * preview_item_height_reduction_factor)
-            if header_height < font_metrics.height(): header_height = font_metrics.height()
-            header_item.setSizeHint(QSize(self.frame_preview.width() - 20, header_height))
-
-            for idx, frame_data in enumerate(self.all_frame_data):
-                delay = frame_data['delay']
-                frame_desc = f"{self._format_frame_number(idx)} : {delay}ms"
-                frame_item = QListWidgetItem(frame_desc)
-                frame_item.setData(Qt.UserRole, idx)
-                if self.selected_index == idx : frame_item.setForeground(QColor("cyan"))
-                self.frame_preview.addItem(frame_item)
-
-                current_item_height = int((font_metrics.height() + item_vertical_padding) * preview_item_height_reduction_factor)
-                if current_item_height < font_metrics.height(): current_item_height = font_metrics.height()
-                frame_item.setSizeHint(QSize(frame_item.sizeHint().width(), current_item_height))
+            preview_rows = [f"--- 전체 프레임 ({frame_count}개) ---"]
+            preview_rows.extend(range(frame_count))
+            self.frame_preview_model.set_rows(preview_rows, preview_header_height, preview_header_width)
 
             self._sync_motion_list_selection()
             return
 
-        sorted_keys = sorted(self.keyframes.keys())
+        sorted_keys = self._get_sorted_keys()
+        self._motion_list_row_keys = sorted_keys # 모션 리스트 행 순서 = 정렬된 키 순서
         font_metrics_motion = QFontMetrics(self.motion_list.font())
-        font_metrics_preview = QFontMetrics(self.frame_preview.font())
-
-        for i, start_frame_idx in enumerate(sorted_keys):
-            end_frame_idx = sorted_keys[i+1] - 1 if i+1 < len(sorted_keys) else len(self.all_frame_data)-1
-            motion_name = self.keyframes[start_frame_idx]
-
-            text_html = (f"<span style='color:{keyframe_color_code};'>{start_frame_idx + 1:02d}</span>"
-                         f"<span style='color:{default_text_color_code};'> ~ {end_frame_idx + 1:02d} : </span>"
-                         f"<span style='color:{keyframe_color_code};'>{motion_name}</span>")
-
-            motion_item = QListWidgetItem()
-            motion_label = QLabel(text_html)
-            motion_label.setStyleSheet("background-color: transparent; padding: 1px 0px;")
-            motion_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-
-            self.motion_list.addItem(motion_item)
-            self.motion_list.setItemWidget(motion_item, motion_label)
-            motion_item.setData(Qt.UserRole, start_frame_idx)
-
-            # 모션 리스트 아이템 높이: 폰트 높이 + 늘린 패딩 (잘림 방지)
-            motion_item_height = font_metrics_motion.height() + item_vertical_padding * 3 # 기존 *2 에서 *3으로 변경 (총 6px)
-            motion_item.setSizeHint(QSize(motion_label.sizeHint().width(), motion_item_height))
-
-
-            header_text = f"--- {motion_name} ({self._format_frame_number(start_frame_idx)} ~ {self._format_frame_number(end_frame_idx)}) ---"
-            header_item_preview = QListWidgetItem(header_text)
-            header_item_preview.setTextAlignment(Qt.AlignmentFlag.AlignCenter); header_item_preview.setForeground(QColor("#FFA07A"))
-            header_item_preview.setData(Qt.UserRole, -1)
-            self.frame_preview.addItem(header_item_preview)
-
-            preview_header_height = int((font_metrics_preview.height() + item_vertical_padding) * preview_item_height_reduction_factor)
-            if preview_header_height < font_metrics_preview.height(): preview_header_height = font_metrics_preview.height()
-            header_item_preview.setSizeHint(QSize(self.frame_preview.width() -20 , preview_header_height))
-
-            for frame_idx_in_segment in range(start_frame_idx, end_frame_idx + 1):
-                if 0 <= frame_idx_in_segment < len(self.all_frame_data):
-                    delay = self.all_frame_data[frame_idx_in_segment]['delay']
-                    frame_desc = f"{self._format_frame_number(frame_idx_in_segment)} : {delay}ms"
-                    frame_item_preview = QListWidgetItem(frame_desc)
-                    frame_item_preview.setData(Qt.UserRole, frame_idx_in_segment)
-                    if self.selected_index == frame_idx_in_segment : frame_item_preview.setForeground(QColor("cyan"))
-                    self.frame_preview.addItem(frame_item_preview)
-
-                    preview_item_height = int((font_metrics_preview.height() + item_vertical_padding) * preview_item_height_reduction_factor)
-                    if preview_item_height < font_metrics_preview.height(): preview_item_height = font_metrics_preview.height()
-                    frame_item_preview.setSizeHint(QSize(frame_item_preview.sizeHint().width(), preview_item_height))
-
+        # 모션 리스트 아이템 높이: 폰트 높이 + 늘린 패딩 (잘림 방지), 모든 아이템이 같으므로 한 번만 계산
+        motion_item_height = font_metrics_motion.height() + item_vertical_padding * 3 # 기존 *2 에서 *3으로 변경 (총 6px)
+        preview_rows = []
+        # 루프 안에서 반복 조회하는 속성/메서드는 지역 변수로 묶어 둠
+        keyframes = self.keyframes
+        format_number = self._format_frame_number
+        add_motion_item = self.motion_list.addItem
+        motion_width = font_metrics_motion.horizontalAdvance
+        key_count = len(sorted_keys)
+        last_frame_idx = frame_count - 1
+
+        # 아이템을 모두 추가할 때까지 모션 리스트 다시 그리기를 멈춤 (아이템마다 레이아웃 갱신 방지)
+        self.motion_list.setUpdatesEnabled(False)
+        try:
+            for i, start_frame_idx in enumerate(sorted_keys):
+                end_frame_idx = sorted_keys[i+1] - 1 if i+1 < key_count else last_frame_idx
+                motion_name = keyframes[start_frame_idx]
+
+                # 색상별 텍스트 구간은 MotionItemDelegate가 그림 (표시 텍스트는 키보드 검색용)
+                text_runs = (f"{start_frame_idx + 1:02d}", f" ~ {end_frame_idx + 1:02d} : ", motion_name)
+                motion_text = "".join(text_runs)
+                motion_item = QListWidgetItem(motion_text)
+                motion_item.setData(Qt.UserRole, start_frame_idx)
+                motion_item.setData(MotionItemDelegate.RUNS_ROLE, text_runs)
+                motion_item.setSizeHint(QSize(motion_width(motion_text), motion_item_height))
+                add_motion_item(motion_item)
+
+                preview_rows.append(f"--- {motion_name} ({format_number(start_frame_idx)} ~ {format_number(end_frame_idx)}) ---")
+                preview_rows.extend(range(max(start_frame_idx, 0), min(end_frame_idx + 1, frame_count)))
+        finally:
+            self.motion_list.setUpdatesEnabled(True)
+
+        self.frame_preview_model.set_rows(preview_rows, preview_header_height, preview_header_width)
         self._sync_motion_list_selection()
 
     def clear_timeline(self):
+        # 제거하는 동안 타임라인 다시 그리기를 멈추고, 뒤에서부터 꺼내 레이아웃 항목 목록의 앞당김을 피함
+        # 프레임 버튼은 지우지 않고 숨겨서 풀에 보관 (다음 GIF 로드 때 재사용)
+        self.timeline_widget.setUpdatesEnabled(False)
         while self.timeline_layout.count():
-            item = self.timeline_layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
+            item = self.timeline_layout.takeAt(self.timeline_layout.count() - 1)
+            widget = item.widget()
+            if isinstance(widget, FrameButton):
+                widget.hide()
+                self._frame_button_pool.append(widget)
+            elif widget:
+                widget.deleteLater()
+        self.timeline_widget.setUpdatesEnabled(True)
         self.frame_buttons.clear()
 
+    def _acquire_frame_button(self, index):
+        if self._frame_button_pool:
+            btn = self._frame_button_pool.pop()
+            btn.index = index
+            btn.setText(str(index + 1))
+            btn.show()
+            return btn
+        # 새 버튼만 크기 설정/시그널 연결 (풀에서 꺼낸 버튼은 생성 시 연결이 그대로 유지됨)
+        btn = FrameButton(str(index + 1), index)
+        btn.setFixedSize(26, 26)
+        btn.clicked.connect(self._on_frame_button_clicked)
+        btn.doubleClickedWithIndex.connect(self.handle_frame_button_double_click)
+        return btn
+
+    def _release_unused_frame_buttons(self):
+        # 새 타임라인을 채우고 남은 버튼은 삭제 (큰 GIF 이후 작은 GIF를 열어도 숨은 버튼이 계속 남지 않도록)
+        for btn in self._frame_button_pool:
+            btn.deleteLater()
+        self._frame_button_pool.clear()
+
     def closeEvent(self, event):
+        if self._exporting:
+            # 작업 스레드가 아직 GIF 파일을 쓰는 중이므로 닫지 않음
+            self._update_status("애니샘플 출력 중에는 종료할 수 없습니다. 출력이 끝난 뒤 다시 시도해주세요.", force=True)
+            event.ignore()
+            return
         if not self._check_unsaved_changes_and_prompt():
             event.ignore()
             return
@@ -16,15 +16,18 @@ from PySide6.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QHBoxLayout, QVBoxLayout,
     QListWidget, QLineEdit, QFileDialog, QScrollArea, QGridLayout, QMessageBox,
     QSizePolicy, QListWidgetItem, QInputDialog, QLayout, QStatusBar,
-    QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QMenu, QGraphicsOpacityEffect,
-    QDialog, QTableWidget, QTableWidgetItem, QHeaderView, QTabWidget, QDialogButtonBox,
+    QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QMenu,
+    QDialog, QTableView, QHeaderView, QTabWidget, QDialogButtonBox,
     QStyleOptionButton, QStyle
 )
 from PySide6.QtGui import (
     QPixmap, QImage, QColor, QFont, QIcon, QFontMetrics, QPainter, QAction, QKeySequence,
     QPen, QPainterPath, QCursor
 )
-from PySide6.QtCore import Qt, QSize, QEvent, QTimer, Signal, QPointF, QObject, QByteArray, QRectF
+from PySide6.QtCore import (
+    Qt, QSize, QEvent, QTimer, Signal, QPointF, QObject, QByteArray, QRectF,
+    QAbstractTableModel, QModelIndex
+)
 import sys, os
 from PIL import Image, ImageSequence, ImagePalette
 import json
@@ -51,6 +54,11 @@ DARKER_COLOR_MAP = {
     "#ffa500": "#cc8400",
 }
 
+# CustomStyledButton 스타일시트에서 배경색을 찾고 바꾸는 정규식 (버튼 누를 때마다 컴파일하지 않도록 미리 준비)
+_STYLE_CONTENT_RE = re.compile(r'\{(.*)\}', re.DOTALL)
+_BG_FIND_RE = re.compile(r"background-color:\s*(#[0-9a-fA-F]{6})", re.IGNORECASE)
+_BG_SUB_RE = re.compile(r"(background-color:\s*)(#[0-9a-fA-F]{6})", re.IGNORECASE)
+
 # ===================================================
 # 커스텀 위젯
 # ===================================================
@@ -78,24 +86,30 @@ class CheckableButton(QPushButton):
         check_box_size = 16
         check_box_margin = 10
         checkbox_rect = QRectF(check_box_margin, (self.height() - check_box_size) / 2, check_box_size, check_box_size)
-        
-        if self.isChecked():
+        text_rect = self.rect().adjusted(int(checkbox_rect.right()) + 5, 0, -10, 0)
+
+        # 다시 그릴 영역에 걸치지 않는 부분(체크박스/텍스트)은 그리지 않음. 버튼 배경은 Qt가 영역에 맞춰 잘라 그림
+        dirty_rect = event.rect()
+        # 체크 해제 상태 테두리(펜 두께 2)까지 포함하도록 여유를 둠
+        draw_checkbox = dirty_rect.intersects(checkbox_rect.adjusted(-1, -1, 1, 1).toAlignedRect())
+        draw_text = dirty_rect.intersects(text_rect)
+
+        if draw_checkbox and self.isChecked():
             painter.setBrush(QColor("#ffa500"))
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawRoundedRect(checkbox_rect, 3, 3)
             
             icon_rect = checkbox_rect.adjusted(2, 2, -2, -2)
             painter.drawPixmap(icon_rect.toRect(), self.checkmark_pixmap)
-        else:
+        elif draw_checkbox:
             pen = QPen(QColor("#ffa500"), 2)
             painter.setPen(pen)
             painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawRoundedRect(checkbox_rect, 3, 3)
 
-        painter.setPen(QColor("white"))
-        
-        text_rect = self.rect().adjusted(int(checkbox_rect.right()) + 5, 0, -10, 0)
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, original_text)
+        if draw_text:
+            painter.setPen(QColor("white"))
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, original_text)
 
 
 class KeyCaptureDialog(QDialog):
@@ -139,6 +153,91 @@ class KeyCaptureDialog(QDialog):
             super().keyPressEvent(event)
 
 
+class ShortcutsTableModel(QAbstractTableModel):
+    """
+    설정 다이얼로그의 단축키 표 모델.
+    행은 [cmd_id, 기능 이름, 단축키, 보조 단축키] 목록이며, 카테고리 헤더 행은 cmd_id가 None.
+    """
+    COLUMN_HEADERS = ("기능", "단축키", "보조 단축키")
+    CATEGORIES = (
+        ("--- 파일 관리 제어 ---", ('SAVE_PROJECT',)),
+        ("--- 재생 제어 ---", ('TOGGLE_PLAYBACK', 'TOGGLE_LOOP', 'PREV_MOTION', 'NEXT_MOTION')),
+        ("--- 타임라인 제어 ---", ('SET_MOTION_KEYFRAME', 'PREV_FRAME', 'NEXT_FRAME')),
+        ("--- 미리보기 제어 ---", ('PREVIEW_ZOOM_IN', 'PREVIEW_ZOOM_OUT', 'PREVIEW_RESET')),
+    )
+    HEADER_BACKGROUND = QColor("#282828")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._header_font = QFont()
+        self._header_font.setBold(True)
+
+    @staticmethod
+    def _key_texts(data):
+        # 표시 문자열은 행을 만들거나 단축키가 바뀔 때만 변환해 둠
+        keys = data.get('keys', [])
+        return [keys[i].toString(QKeySequence.SequenceFormat.NativeText) if len(keys) > i and not keys[i].isEmpty() else ""
+                for i in (0, 1)]
+
+    def set_shortcuts(self, shortcuts):
+        self.beginResetModel()
+        self._rows = []
+        for cat_name, cmd_ids in self.CATEGORIES:
+            self._rows.append([None, cat_name, "", ""])
+            for cmd_id in cmd_ids:
+                if cmd_id not in shortcuts: continue
+                data = shortcuts[cmd_id]
+                self._rows.append([cmd_id, data['name'], *self._key_texts(data)])
+        self.endResetModel()
+
+    def update_keys(self, row, data):
+        self._rows[row][2:] = self._key_texts(data)
+        self.dataChanged.emit(self.index(row, 1), self.index(row, 2), [Qt.ItemDataRole.DisplayRole])
+
+    def header_rows(self):
+        return [row for row, entry in enumerate(self._rows) if entry[0] is None]
+
+    def cmd_id_at(self, row):
+        return self._rows[row][0] if 0 <= row < len(self._rows) else None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMN_HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._rows[index.row()]
+        is_header = entry[0] is None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return entry[index.column() + 1]
+        if role == Qt.ItemDataRole.UserRole:
+            return entry[0]
+        if is_header:
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return self.HEADER_BACKGROUND
+            if role == Qt.ItemDataRole.FontRole:
+                return self._header_font
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if self._rows[index.row()][0] is None:
+            return Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMN_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class SettingsDialog(QDialog):
     """
     단축키 및 기타 프로그램 설정을 위한 다이얼로그.
@@ -170,14 +269,18 @@ class SettingsDialog(QDialog):
         shortcuts_tab = QWidget()
         shortcuts_layout = QVBoxLayout(shortcuts_tab)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["기능", "단축키", "보조 단축키"])
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.shortcuts_model = ShortcutsTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.shortcuts_model)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        # 열 너비는 헤더의 크기 조정 모드가 맡음 (표를 다시 채울 때마다 전체 크기 계산을 하지 않음)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
         self.table.setStyleSheet(f"""
-            QTableWidget {{ 
+            QTableView {{ 
                 background-color: #1E1E1E; 
                 color: #DCDCDC; 
                 gridline-color: #444; 
@@ -188,7 +291,7 @@ class SettingsDialog(QDialog):
                 color: white; padding: 4px; 
                 border: 1px solid #2A2A2A; 
             }}
-            QTableWidgetItem {{ padding: 5px; }}
+            QTableView::item {{ padding: 5px; }}
             {self.common_scrollbar_style}
         """)
 
@@ -214,7 +317,7 @@ class SettingsDialog(QDialog):
         
         main_layout.addWidget(button_box)
 
-        self.table.itemDoubleClicked.connect(self.edit_shortcut)
+        self.table.doubleClicked.connect(self.edit_shortcut)
         reset_button.clicked.connect(self.reset_to_defaults)
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
@@ -222,75 +325,19 @@ class SettingsDialog(QDialog):
         self.populate_table()
 
     def populate_table(self):
-        self.table.clearContents()
-        
-        categories = {
-            "File": ("--- 파일 관리 제어 ---", ['SAVE_PROJECT']),
-            "Playback": ("--- 재생 제어 ---", ['TOGGLE_PLAYBACK', 'TOGGLE_LOOP', 'PREV_MOTION', 'NEXT_MOTION']),
-            "Timeline": ("--- 타임라인 제어 ---", ['SET_MOTION_KEYFRAME', 'PREV_FRAME', 'NEXT_FRAME']),
-            "Preview": ("--- 미리보기 제어 ---", ['PREVIEW_ZOOM_IN', 'PREVIEW_ZOOM_OUT', 'PREVIEW_RESET'])
-        }
-
-        row_count = sum(len(cmds) for _, cmds in categories.values()) + len(categories)
-        self.table.setRowCount(row_count)
-        
-        current_row = 0
-        for cat_key in ["File", "Playback", "Timeline", "Preview"]:
-            if cat_key not in categories: continue
-            cat_name, cmd_ids = categories[cat_key]
-
-            header_item = QTableWidgetItem(cat_name)
-            header_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            header_item.setBackground(QColor("#282828"))
-            font = header_item.font()
-            font.setBold(True)
-            header_item.setFont(font)
-            header_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            self.table.setItem(current_row, 0, header_item)
-            self.table.setSpan(current_row, 0, 1, 3) 
-            current_row += 1
-
-            for cmd_id in cmd_ids:
-                if cmd_id not in self.shortcuts: continue
-                
-                data = self.shortcuts[cmd_id]
-                name_item = QTableWidgetItem(data['name'])
-                name_item.setData(Qt.ItemDataRole.UserRole, cmd_id)
-                self.table.setItem(current_row, 0, name_item)
-
-                keys = data.get('keys', [])
-                
-                if len(keys) > 0 and not keys[0].isEmpty():
-                    self.table.setItem(current_row, 1, QTableWidgetItem(keys[0].toString(QKeySequence.SequenceFormat.NativeText)))
-                else:
-                    self.table.setItem(current_row, 1, QTableWidgetItem(""))
-
-                if len(keys) > 1 and not keys[1].isEmpty():
-                    self.table.setItem(current_row, 2, QTableWidgetItem(keys[1].toString(QKeySequence.SequenceFormat.NativeText)))
-                else:
-                    self.table.setItem(current_row, 2, QTableWidgetItem(""))
-
-                current_row += 1
-
-        self.table.resizeColumnsToContents()
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-
-    def edit_shortcut(self, item):
-        row = item.row()
-        col = item.column()
+        self.shortcuts_model.set_shortcuts(self.shortcuts)
+        self.table.clearSpans()
+        for row in self.shortcuts_model.header_rows():
+            self.table.setSpan(row, 0, 1, 3)
+
+    def edit_shortcut(self, index):
+        row = index.row()
+        col = index.column()
         
         if col == 0: return
 
-        if not item.flags() & Qt.ItemFlag.ItemIsSelectable:
-            name_item = self.table.item(row, 0)
-            if not name_item or not (name_item.flags() & Qt.ItemFlag.ItemIsSelectable):
-                return
-        
-        cmd_id_item = self.table.item(row, 0)
-        if not cmd_id_item: return
-        cmd_id = cmd_id_item.data(Qt.ItemDataRole.UserRole)
+        # 카테고리 헤더 행은 cmd_id가 없으므로 여기서 걸러짐
+        cmd_id = self.shortcuts_model.cmd_id_at(row)
         if not cmd_id: return
 
         dialog = KeyCaptureDialog(self)
@@ -307,7 +354,8 @@ class SettingsDialog(QDialog):
             
             self.shortcuts[cmd_id]['keys'] = [k for k in current_keys if not k.isEmpty()]
 
-            self.populate_table()
+            # 표 전체를 다시 만들지 않고 바뀐 행의 단축키 칸만 갱신
+            self.shortcuts_model.update_keys(row, self.shortcuts[cmd_id])
 
     def reset_to_defaults(self):
         reply = QMessageBox.question(self, "초기화 확인",
@@ -327,31 +375,46 @@ class OverlayLabel(QLabel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._outline_pen = QPen(QColor(0, 0, 0, int(255 * 0.5)))
+        self._outline_pen.setWidth(4)
+        self._fill_color = QColor("#d9d9d9")
+        # 글자 외곽선 경로 캐시: (텍스트, 글자 크기, 너비, 높이)가 같으면 addText를 다시 하지 않음
+        self._cache_key = None
+        self._cached_path = None
+
+    def _text_path(self):
+        text = self.text()
+        font_size = max(12, int(self.width() / 40))
+        key = (text, font_size, self.width(), self.height())
+        if key == self._cache_key:
+            return self._cached_path
 
         path = QPainterPath()
         font = QFont("Arial", 48, QFont.Bold)
-        
-        font_size = max(12, int(self.width() / 40))
         font.setPointSize(font_size)
         
         fm = QFontMetrics(font)
-        text_width = fm.horizontalAdvance(self.text())
+        text_width = fm.horizontalAdvance(text)
         text_height = fm.height()
         x = (self.width() - text_width) / 2
         y = (self.height() - text_height) / 2 + fm.ascent()
 
-        path.addText(x, y, font, self.text())
+        path.addText(x, y, font, text)
+
+        self._cache_key = key
+        self._cached_path = path
+        return path
 
-        pen = QPen(QColor(0, 0, 0, int(255 * 0.5)))
-        pen.setWidth(4)
-        painter.setPen(pen)
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        path = self._text_path()
+
+        painter.setPen(self._outline_pen)
         painter.drawPath(path)
 
-        painter.fillPath(path, QColor("#d9d9d9"))
+        painter.fillPath(path, self._fill_color)
 
 
 class CustomStyledButton(QPushButton):
@@ -363,67 +426,60 @@ class CustomStyledButton(QPushButton):
         else:
             super().__init__(parent)
 
-        self._normal_style_sheet = self.styleSheet()
-        self._pressed_style_sheet = self._derive_pressed_style(self._normal_style_sheet)
-        self._is_currently_pressed = False
+        self._normal_style_sheet = super().styleSheet()
 
     def setCustomStyles(self, normal_style, pressed_style):
         self._normal_style_sheet = normal_style
-        self._pressed_style_sheet = pressed_style
-        if not self._is_currently_pressed:
-            super().setStyleSheet(self._normal_style_sheet)
-        else:
-            super().setStyleSheet(self._pressed_style_sheet)
+        pressed_bg_hex = CustomStyledButton._extract_background_color_hex(pressed_style)
+        super().setStyleSheet(self._derive_pressed_style(normal_style, pressed_bg_hex))
 
     def setStyleSheet(self, styleSheet):
-        super().setStyleSheet(styleSheet)
         self._normal_style_sheet = styleSheet
-        self._pressed_style_sheet = self._derive_pressed_style(self._normal_style_sheet)
-
-    def _derive_pressed_style(self, base_style):
-        current_bg_hex = CustomStyledButton._extract_background_color_hex(base_style)
-        if current_bg_hex:
-            darker_bg_hex = DARKER_COLOR_MAP.get(current_bg_hex.upper())
-            if darker_bg_hex:
-                return CustomStyledButton._replace_background_color_in_style(base_style, darker_bg_hex)
-        return base_style
+        super().setStyleSheet(self._derive_pressed_style(styleSheet))
 
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton and self.isEnabled():
-            self._is_currently_pressed = True
-            if self._pressed_style_sheet:
-                 super().setStyleSheet(self._pressed_style_sheet)
-        super().mousePressEvent(event)
+    def styleSheet(self):
+        # :pressed 규칙이 덧붙기 전의 원래 스타일을 돌려줌 (이어붙여 다시 설정해도 규칙이 중복되지 않도록)
+        return self._normal_style_sheet
 
-    def mouseReleaseEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton and self.isEnabled() and self._is_currently_pressed:
-            self._is_currently_pressed = False
-            super().setStyleSheet(self._normal_style_sheet)
-        super().mouseReleaseEvent(event)
+    def _derive_pressed_style(self, base_style, pressed_bg_hex=None):
+        """
+        기본 스타일 뒤에 눌림 배경색용 :pressed 규칙을 한 번만 덧붙인 스타일시트를 만듦.
+        누름/뗌 때마다 스타일시트를 교체하지 않고 Qt가 눌림 상태에 맞춰 그리도록 함.
+        """
+        if pressed_bg_hex is None:
+            current_bg_hex = CustomStyledButton._extract_background_color_hex(base_style)
+            if current_bg_hex:
+                pressed_bg_hex = DARKER_COLOR_MAP.get(current_bg_hex.upper())
+        if not pressed_bg_hex:
+            return base_style
+        if '{' not in base_style:
+            # 선택자 없는 속성 문자열이면 규칙 형태로 감싸야 :pressed 규칙을 덧붙일 수 있음
+            base_style = f"CustomStyledButton {{ {base_style} }}"
+        return f"{base_style}\nCustomStyledButton:pressed {{ background-color: {pressed_bg_hex}; }}"
 
     @staticmethod
     def _extract_background_color_hex(style_sheet_str):
         if not style_sheet_str: return None
+        # 배경색 속성이 아예 없으면 정규식을 돌릴 필요 없음 (IGNORECASE 검색과 맞추기 위해 소문자로 비교)
+        if 'background-color' not in style_sheet_str.lower(): return None
         # CSS 선택자(Selector) 부분을 제외하고 속성 부분에서만 색상을 찾도록 정규식 수정
         # 예: "CustomStyledButton { background-color: #FFFFFF; }"
-        style_content_match = re.search(r'\{(.*)\}', style_sheet_str, re.DOTALL)
+        style_content_match = _STYLE_CONTENT_RE.search(style_sheet_str)
         search_area = style_content_match.group(1) if style_content_match else style_sheet_str
         
-        matches = re.findall(r"background-color:\s*(#[0-9a-fA-F]{6})", search_area, re.IGNORECASE)
-        if matches:
-            return matches[0]
+        match = _BG_FIND_RE.search(search_area)
+        if match:
+            return match.group(1)
         return None
 
     @staticmethod
     def _replace_background_color_in_style(original_style, new_bg_color_hex):
         if not original_style: original_style = ""
         # CSS 선택자(Selector) 부분을 유지하면서 색상만 교체
-        replaced_style, num_replacements = re.subn(
-            r"(background-color:\s*)(#[0-9a-fA-F]{6})",
+        replaced_style, num_replacements = _BG_SUB_RE.subn(
             rf"\g<1>{new_bg_color_hex}",
             original_style,
-            count=1,
-            flags=re.IGNORECASE
+            count=1
         )
         if num_replacements > 0:
             return replaced_style
@@ -462,10 +518,7 @@ class ShortcutProofListWidget(QListWidget):
         눌린 키가 전역 단축키로 등록된 경우, 이벤트를 무시하여
         상위 위젯(메인 윈도우)의 eventFilter가 처리하도록 합니다.
         """
-        sequence = QKeySequence(event.keyCombination())
-        key_str = sequence.toString(QKeySequence.SequenceFormat.PortableText)
-
-        if key_str in self.parent_ui.shortcut_map:
+        if event.keyCombination().toCombined() in self.parent_ui.shortcut_combo_ints:
             event.ignore()
             return 
         
@@ -494,11 +547,8 @@ class ShortcutProofScrollArea(QScrollArea):
         눌린 키가 전역 단축키로 등록된 경우, 이벤트를 무시하여
         상위 위젯(메인 윈도우)의 eventFilter가 처리하도록 합니다.
         """
-        sequence = QKeySequence(event.keyCombination())
-        key_str = sequence.toString(QKeySequence.SequenceFormat.PortableText)
-
         # 등록된 단축키인지 확인
-        if key_str in self.parent_ui.shortcut_map:
+        if event.keyCombination().toCombined() in self.parent_ui.shortcut_combo_ints:
             event.ignore()  # 이벤트를 무시하고 부모 위젯으로 전달
             return
 
@@ -509,11 +559,6 @@ class ShortcutProofScrollArea(QScrollArea):
 class OpacityButton(QPushButton):
     def __init__(self, icon_path="", parent=None):
         super().__init__(parent)
-        if icon_path:
-            self.setIcon(QIcon(icon_path))
-
-        self.opacity_effect = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self.opacity_effect)
 
         self.base_opacity_enabled = 0.20
         self.base_opacity_disabled = 0.05
@@ -523,17 +568,42 @@ class OpacityButton(QPushButton):
         self._is_pressed = False
         self._is_hovered = False
 
+        # 상태별 투명도를 미리 입힌 아이콘. QGraphicsOpacityEffect처럼 매 페인트마다 화면 밖에 그려 합성하지 않음
+        # (버튼 배경은 투명/테두리 없음이라 아이콘 투명도만 바꾸면 보이는 결과가 같음)
+        self._opacity_icons = {}
+        self._current_opacity = None
+        source = QPixmap(icon_path) if icon_path else QPixmap()
+        if not source.isNull():
+            for opacity in (self.base_opacity_enabled, self.base_opacity_disabled, self.hover_opacity, self.pressed_opacity):
+                self._opacity_icons[opacity] = QIcon(self._pixmap_with_opacity(source, opacity))
+
         self._update_opacity()
 
+    @staticmethod
+    def _pixmap_with_opacity(source, opacity):
+        pixmap = QPixmap(source.size())
+        pixmap.setDevicePixelRatio(source.devicePixelRatio())
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setOpacity(opacity)
+        painter.drawPixmap(0, 0, source)
+        painter.end()
+        return pixmap
+
     def _update_opacity(self):
         if not self.isEnabled():
-            self.opacity_effect.setOpacity(self.base_opacity_disabled)
+            opacity = self.base_opacity_disabled
         elif self._is_pressed:
-            self.opacity_effect.setOpacity(self.pressed_opacity)
+            opacity = self.pressed_opacity
         elif self._is_hovered:
-            self.opacity_effect.setOpacity(self.hover_opacity)
+            opacity = self.hover_opacity
         else:
-            self.opacity_effect.setOpacity(self.base_opacity_enabled)
+            opacity = self.base_opacity_enabled
+
+        if opacity == self._current_opacity or opacity not in self._opacity_icons:
+            return
+        self._current_opacity = opacity
+        self.setIcon(self._opacity_icons[opacity])
 
     def setEnabled(self, enabled):
         super().setEnabled(enabled)
@@ -578,6 +648,13 @@ class DroppableGraphicsView(QGraphicsView):
         self.parent_app = parent_app
         self.setAcceptDrops(True)
 
+        # 한 번의 이벤트 루프 동안 쌓인 휠 입력을 모아 배율을 한 번만 바꿈 (터치패드처럼 이벤트가 몰려올 때)
+        self._pending_wheel_steps = 0
+        self._wheel_flush_timer = QTimer(self)
+        self._wheel_flush_timer.setSingleShot(True)
+        self._wheel_flush_timer.setInterval(0)
+        self._wheel_flush_timer.timeout.connect(self._flush_wheel_steps)
+
     def dragEnterEvent(self, event):
         self.parent_app.dragEnterEvent(event)
 
@@ -594,12 +671,28 @@ class DroppableGraphicsView(QGraphicsView):
         if self.parent_app.all_frame_data:
             delta = event.angleDelta().y()
             if delta < 0:
-                self.parent_app._change_preview_scale(-1)
+                self._pending_wheel_steps -= 1
             elif delta > 0:
-                self.parent_app._change_preview_scale(1)
+                self._pending_wheel_steps += 1
+            if not self._wheel_flush_timer.isActive():
+                self._wheel_flush_timer.start()
             event.accept()
         else:
             event.ignore()
+
+    def _flush_wheel_steps(self):
+        steps = self._pending_wheel_steps
+        self._pending_wheel_steps = 0
+        if not steps:
+            return
+        app = self.parent_app
+        # 배율 범위를 넘는 만큼은 잘라서 한 번에 적용하고, 넘쳤다면 한 칸 더 보내 최소/최대 배율 안내를 띄움
+        requested_index = app.current_scale_index + steps
+        target_index = min(max(requested_index, 0), len(app.scale_levels) - 1)
+        if target_index != app.current_scale_index:
+            app._change_preview_scale(target_index - app.current_scale_index)
+        if requested_index != target_index:
+            app._change_preview_scale(1 if steps > 0 else -1)
     
     def mouseReleaseEvent(self, event):
         super().mouseReleaseEvent(event)
@@ -639,6 +732,7 @@ class GifSplitterUI(QWidget):
         
         self.shortcuts = {}
         self.shortcut_map = {}
+        self.shortcut_combo_ints = frozenset()
         
         self.pressed_motion_list_item = None
         self.pressed_frame_preview_item = None
@@ -854,6 +948,13 @@ class GifSplitterUI(QWidget):
                 if not key_seq.isEmpty():
                     key_str = key_seq.toString(QKeySequence.SequenceFormat.PortableText)
                     self.shortcut_map[key_str] = cmd_id
+        # 단일 키 조합 단축키의 정수값 집합 (ShortcutProof* 위젯이 키 입력마다 문자열 변환 없이 확인)
+        self.shortcut_combo_ints = frozenset(
+            key_seq[0].toCombined()
+            for data in self.shortcuts.values()
+            for key_seq in data.get('keys', [])
+            if key_seq.count() == 1
+        )
 
     def open_settings_dialog(self):
         import copy